@@ -1,13 +1,114 @@
 """Amazon Bedrock APIクライアント"""
 
-import json
-from typing import Optional
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+# orjsonによる高速シリアライズはオプション
+try:
+    import orjson as _json
+
+    _dumps = _json.dumps
+    _loads = _json.loads
+except ImportError:
+    import json as _json
+
+    def _dumps(obj):
+        return _json.dumps(obj).encode("utf-8")
+
+    _loads = _json.loads
+
 from .config import BedrockConfig
 
+# セッションとクライアントをプロセス内で再利用する
+# （認証情報の再解決とTLSハンドシェイクを呼び出しごとに繰り返さないため）
+_SESSION = boto3.session.Session()
+_CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    tcp_keepalive=True,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+_CLIENTS: dict[str, object] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+# 決定的な呼び出し（temperature=0）のレスポンスキャッシュ
+# generate_manyが複数スレッドからgenerateを呼ぶため、
+# 参照・削除・並べ替えはロックで直列化する
+_RESPONSE_CACHE: OrderedDict[str, tuple[str, float]] = OrderedDict()
+_RESPONSE_CACHE_LOCK = threading.Lock()
+_RESPONSE_CACHE_MAX_ENTRIES = 128
+_RESPONSE_CACHE_TTL_SECONDS = 3600.0
+
+
+def _response_cache_key(
+    model_id: str,
+    prompt: str,
+    system_prompt: Optional[str],
+    temperature: float,
+    cacheable_prefix: Optional[str] = None,
+) -> str:
+    """レスポンスキャッシュのキーを生成する"""
+    payload = _dumps(
+        {
+            "model": model_id,
+            "system": system_prompt,
+            "prefix": cacheable_prefix,
+            "prompt": prompt,
+            "temperature": temperature,
+        }
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _response_cache_get(key: str) -> Optional[str]:
+    """キャッシュからレスポンスを取得する（期限切れはNone）"""
+    with _RESPONSE_CACHE_LOCK:
+        entry = _RESPONSE_CACHE.get(key)
+        if entry is None:
+            return None
+        text, timestamp = entry
+        if time.monotonic() - timestamp > _RESPONSE_CACHE_TTL_SECONDS:
+            # 同じ期限切れキーに並行到達してもpopなら2回目は何もしない
+            _RESPONSE_CACHE.pop(key, None)
+            return None
+        _RESPONSE_CACHE.move_to_end(key)
+        return text
+
+
+def _response_cache_put(key: str, text: str) -> None:
+    """レスポンスをキャッシュに保存する"""
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE[key] = (text, time.monotonic())
+        _RESPONSE_CACHE.move_to_end(key)
+        while len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAX_ENTRIES:
+            _RESPONSE_CACHE.popitem(last=False)
+
+
+def _get_client(region_name: str):
+    """リージョンごとにキャッシュされたbedrock-runtimeクライアントを取得する
+
+    クライアント自体はスレッドセーフだが、生成はロックで直列化して
+    ワーカースレッドからの同時初期化による重複生成を防ぐ。
+    """
+    client = _CLIENTS.get(region_name)
+    if client is None:
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(region_name)
+            if client is None:
+                client = _SESSION.client(
+                    "bedrock-runtime", region_name=region_name, config=_CLIENT_CONFIG
+                )
+                _CLIENTS[region_name] = client
+    return client
+
 
 class BedrockClient:
     """Amazon Bedrock Claude APIクライアント"""
@@ -20,17 +121,23 @@ class BedrockClient:
             config: Bedrock設定。Noneの場合は環境変数から読み込む
         """
         self.config = config or BedrockConfig.from_env()
-        self._client = boto3.client(
-            "bedrock-runtime", region_name=self.config.region_name
-        )
+        self._client = _get_client(self.config.region_name)
 
-    def generate(self, prompt: str, system_prompt: Optional[str] = None) -> str:
+    def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        cacheable_prefix: Optional[str] = None,
+    ) -> str:
         """
         Claudeモデルを使用してテキストを生成する
 
         Args:
             prompt: ユーザープロンプト
             system_prompt: システムプロンプト（オプション）
+            cacheable_prefix: 週をまたいで再送される静的なコンテキスト
+                （オプション）。指定するとcache_controlブロックとして
+                送信され、サーバー側のプロンプトキャッシュが効く
 
         Returns:
             生成されたテキスト
@@ -38,7 +145,34 @@ class BedrockClient:
         Raises:
             BedrockError: API呼び出しに失敗した場合
         """
-        messages = [{"role": "user", "content": prompt}]
+        # temperature=0の呼び出しは決定的なのでキャッシュを使う
+        cache_key = None
+        if self.config.temperature == 0:
+            cache_key = _response_cache_key(
+                self.config.model_id,
+                prompt,
+                system_prompt,
+                self.config.temperature,
+                cacheable_prefix,
+            )
+            cached = _response_cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        if cacheable_prefix:
+            # 静的な前置きコンテキストをキャッシュ対象ブロックとして分離する
+            content: object = [
+                {
+                    "type": "text",
+                    "text": cacheable_prefix,
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {"type": "text", "text": prompt},
+            ]
+        else:
+            content = prompt
+
+        messages = [{"role": "user", "content": content}]
 
         body = {
             "anthropic_version": "bedrock-2023-05-31",
@@ -53,17 +187,105 @@ class BedrockClient:
         try:
             response = self._client.invoke_model(
                 modelId=self.config.model_id,
-                body=json.dumps(body),
+                body=_dumps(body),
+                contentType="application/json",
+                accept="application/json",
+            )
+
+            response_body = _loads(response["body"].read())
+            text = response_body["content"][0]["text"]
+
+            if cache_key is not None:
+                _response_cache_put(cache_key, text)
+
+            return text
+
+        except ClientError as e:
+            raise BedrockError(f"Bedrock API呼び出しに失敗しました: {e}") from e
+
+    def generate_stream(
+        self, prompt: str, system_prompt: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Claudeモデルの応答をストリーミングで生成する
+
+        invoke_modelは全文生成まで数秒〜数十秒ブロックするが、
+        こちらはトークンが届き次第yieldするため、呼び出し側は
+        最初のトークンから表示を始められる。
+
+        Args:
+            prompt: ユーザープロンプト
+            system_prompt: システムプロンプト（オプション）
+
+        Yields:
+            生成されたテキストの断片
+
+        Raises:
+            BedrockError: API呼び出しに失敗した場合
+        """
+        messages = [{"role": "user", "content": prompt}]
+
+        body = {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": self.config.max_tokens,
+            "temperature": self.config.temperature,
+            "messages": messages,
+        }
+
+        if system_prompt:
+            body["system"] = system_prompt
+
+        try:
+            response = self._client.invoke_model_with_response_stream(
+                modelId=self.config.model_id,
+                body=_dumps(body),
                 contentType="application/json",
                 accept="application/json",
             )
 
-            response_body = json.loads(response["body"].read())
-            return response_body["content"][0]["text"]
+            for event in response["body"]:
+                chunk = _loads(event["chunk"]["bytes"])
+                if chunk.get("type") == "content_block_delta":
+                    text = chunk["delta"].get("text")
+                    if text:
+                        yield text
 
         except ClientError as e:
             raise BedrockError(f"Bedrock API呼び出しに失敗しました: {e}") from e
 
+    # 並列呼び出しの同時実行数（Bedrockクォータへの配慮）
+    MAX_CONCURRENT_REQUESTS = 8
+
+    def generate_many(
+        self, prompts: list[str], system_prompt: Optional[str] = None
+    ) -> list[str]:
+        """
+        複数プロンプトを並列に生成する
+
+        boto3クライアントはスレッドセーフなため、共有コネクションプールを
+        使ってN件の逐次呼び出しをほぼ1往復分の時間に短縮する。
+
+        Args:
+            prompts: ユーザープロンプトのリスト
+            system_prompt: システムプロンプト（全プロンプト共通、オプション）
+
+        Returns:
+            入力と同順の生成テキストのリスト
+
+        Raises:
+            BedrockError: いずれかのAPI呼び出しに失敗した場合
+        """
+        if not prompts:
+            return []
+
+        max_workers = min(self.MAX_CONCURRENT_REQUESTS, len(prompts))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.generate, prompt, system_prompt)
+                for prompt in prompts
+            ]
+            return [future.result() for future in futures]
+
     def test_connection(self) -> bool:
         """
         Bedrock APIへの接続をテストする
@@ -2,14 +2,15 @@
 
 import sys
 
-from dotenv import load_dotenv
-
-from .bedrock_client import BedrockClient, BedrockError
-from .config import AppConfig
-
 
 def test_bedrock_connection() -> None:
     """Bedrock APIへの接続をテストする"""
+    # boto3のインポートはCLI起動の大半を占めるため、必要になるまで遅延させる
+    from dotenv import load_dotenv
+
+    from .bedrock_client import BedrockClient, BedrockError
+    from .config import AppConfig
+
     load_dotenv()
     config = AppConfig.load()
 
@@ -31,6 +32,8 @@ def test_bedrock_connection() -> None:
 
 def run_gui() -> None:
     """GUIアプリケーションを起動する"""
+    from dotenv import load_dotenv
+
     load_dotenv()
     from .gui import MainWindow
 
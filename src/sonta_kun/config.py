@@ -2,9 +2,10 @@
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass
+@dataclass(slots=True)
 class BedrockConfig:
     """Amazon Bedrock設定"""
 
@@ -14,8 +15,9 @@ class BedrockConfig:
     temperature: float = 0.7
 
     @classmethod
+    @lru_cache(maxsize=1)
     def from_env(cls) -> "BedrockConfig":
-        """環境変数から設定を読み込む"""
+        """環境変数から設定を読み込む（プロセス内でキャッシュされる）"""
         return cls(
             region_name=os.getenv("AWS_REGION", "ap-northeast-1"),
             model_id=os.getenv(
@@ -26,13 +28,18 @@ class BedrockConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     """アプリケーション設定"""
 
     bedrock: BedrockConfig
 
     @classmethod
+    @lru_cache(maxsize=1)
     def load(cls) -> "AppConfig":
-        """設定を読み込む"""
+        """設定を読み込む（プロセス内でキャッシュされる）
+
+        環境変数を変更した後に再読み込みする場合は
+        `AppConfig.load.cache_clear()` を呼ぶ。
+        """
         return cls(bedrock=BedrockConfig.from_env())
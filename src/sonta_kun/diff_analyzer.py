@@ -1,13 +1,31 @@
 """差分分析モジュール"""
 
 from dataclasses import dataclass, field
-from difflib import SequenceMatcher
+from difflib import get_close_matches
+from functools import lru_cache
+from io import StringIO
 from typing import Optional
 
+# RapidFuzz（C++実装）による高速類似度計算はオプション
+try:
+    from rapidfuzz import fuzz, process
+
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# process.cdistによる一括類似度計算にはnumpyが必要
+try:
+    import numpy  # noqa: F401
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 from .excel_reader import TodoItem, TodoList
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskChange:
     """タスクの変更情報"""
 
@@ -18,7 +36,7 @@ class TaskChange:
     details: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DiffResult:
     """差分分析結果"""
 
@@ -30,45 +48,51 @@ class DiffResult:
 
     def to_text(self) -> str:
         """テキスト形式に変換"""
-        lines = []
+        buf = StringIO()
+        write = buf.write
+
+        def write_line(text: str) -> None:
+            if buf.tell():
+                write("\n")
+            write(text)
 
         if self.completed_tasks:
-            lines.append("【完了したタスク】")
+            write_line("【完了したタスク】")
             for task in self.completed_tasks:
-                lines.append(f"  - {task.task_name}")
+                write_line(f"  - {task.task_name}")
                 if task.details:
-                    lines.append(f"    {task.details}")
-            lines.append("")
+                    write_line(f"    {task.details}")
+            write_line("")
 
         if self.new_tasks:
-            lines.append("【新規タスク】")
+            write_line("【新規タスク】")
             for task in self.new_tasks:
-                lines.append(f"  - {task.task_name}")
+                write_line(f"  - {task.task_name}")
                 if task.current_status:
-                    lines.append(f"    ステータス: {task.current_status}")
-            lines.append("")
+                    write_line(f"    ステータス: {task.current_status}")
+            write_line("")
 
         if self.modified_tasks:
-            lines.append("【変更されたタスク】")
+            write_line("【変更されたタスク】")
             for task in self.modified_tasks:
-                lines.append(f"  - {task.task_name}")
-                lines.append(f"    {task.previous_status} → {task.current_status}")
-            lines.append("")
+                write_line(f"  - {task.task_name}")
+                write_line(f"    {task.previous_status} → {task.current_status}")
+            write_line("")
 
         if self.removed_tasks:
-            lines.append("【削除/中止されたタスク】")
+            write_line("【削除/中止されたタスク】")
             for task in self.removed_tasks:
-                lines.append(f"  - {task.task_name}")
-            lines.append("")
+                write_line(f"  - {task.task_name}")
+            write_line("")
 
         if self.unchanged_tasks:
-            lines.append(f"【継続中のタスク】({len(self.unchanged_tasks)}件)")
+            write_line(f"【継続中のタスク】({len(self.unchanged_tasks)}件)")
             for task in self.unchanged_tasks[:5]:  # 最大5件表示
-                lines.append(f"  - {task.task_name}")
+                write_line(f"  - {task.task_name}")
             if len(self.unchanged_tasks) > 5:
-                lines.append(f"  ... 他{len(self.unchanged_tasks) - 5}件")
+                write_line(f"  ... 他{len(self.unchanged_tasks) - 5}件")
 
-        return "\n".join(lines)
+        return buf.getvalue()
 
     def get_summary(self) -> str:
         """サマリを取得"""
@@ -93,6 +117,9 @@ class DiffAnalyzer:
     # 完了を示すステータス
     COMPLETED_STATUSES = ["完了", "done", "closed", "finished", "完", "済"]
 
+    # 完全一致判定用の事前計算済みセット（すべて小文字）
+    _COMPLETED_SET = frozenset(COMPLETED_STATUSES)
+
     # 類似度の閾値
     SIMILARITY_THRESHOLD = 0.6
 
@@ -125,48 +152,56 @@ class DiffAnalyzer:
                 )
             return result
 
-        # 前回タスクをマッピング
-        previous_tasks = {item.task: item for item in previous.items}
-        matched_previous = set()
+        # 前回タスクをマッピング（同名タスクはリストで保持し、上書きによる
+        # 取りこぼしを防ぐ）
+        previous_buckets: dict[str, list[TodoItem]] = {}
+        for item in previous.items:
+            previous_buckets.setdefault(item.task, []).append(item)
 
+        pending: list[TodoItem] = []
+
+        # 第1パス: 完全一致（同名の前回タスクを1件ずつ消費する）
         for current_item in current.items:
-            # 完全一致を探す
-            if current_item.task in previous_tasks:
-                prev_item = previous_tasks[current_item.task]
-                matched_previous.add(current_item.task)
+            bucket = previous_buckets.get(current_item.task)
+            if bucket:
+                prev_item = bucket.pop(0)
 
                 change = self._compare_items(prev_item, current_item)
                 self._add_to_result(result, change)
             else:
-                # 類似タスクを探す
-                similar_task = self._find_similar_task(
-                    current_item.task, previous_tasks.keys(), matched_previous
-                )
+                pending.append(current_item)
 
-                if similar_task:
-                    prev_item = previous_tasks[similar_task]
-                    matched_previous.add(similar_task)
+        # 第2パス: 未マッチ分の類似マッチングを一括実行
+        remaining = [name for name, bucket in previous_buckets.items() if bucket]
+        assignments = self._match_similar_tasks(
+            [item.task for item in pending], remaining
+        )
 
-                    change = self._compare_items(
-                        prev_item, current_item, task_renamed=True
-                    )
-                    self._add_to_result(result, change)
-                else:
-                    # 新規タスク
-                    result.new_tasks.append(
-                        TaskChange(
-                            task_name=current_item.task,
-                            change_type="new",
-                            current_status=current_item.status,
-                        )
+        for idx, current_item in enumerate(pending):
+            similar_task = assignments.get(idx)
+            if similar_task:
+                prev_item = previous_buckets[similar_task].pop(0)
+
+                change = self._compare_items(
+                    prev_item, current_item, task_renamed=True
+                )
+                self._add_to_result(result, change)
+            else:
+                # 新規タスク
+                result.new_tasks.append(
+                    TaskChange(
+                        task_name=current_item.task,
+                        change_type="new",
+                        current_status=current_item.status,
                     )
+                )
 
-        # 削除されたタスクを検出
-        for task_name, prev_item in previous_tasks.items():
-            if task_name not in matched_previous:
+        # 削除されたタスクを検出（どのパスにもマッチしなかった残り）
+        for bucket in previous_buckets.values():
+            for prev_item in bucket:
                 result.removed_tasks.append(
                     TaskChange(
-                        task_name=task_name,
+                        task_name=prev_item.task,
                         change_type="removed",
                         previous_status=prev_item.status,
                     )
@@ -231,33 +266,88 @@ class DiffAnalyzer:
                 current_status=current.status,
             )
 
-    def _is_completed(self, status: str) -> bool:
-        """ステータスが完了かどうかを判定"""
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _is_completed(status: str) -> bool:
+        """ステータスが完了かどうかを判定（ステータス文字列ごとにメモ化）"""
         if not status:
             return False
         status_lower = status.lower().strip()
-        return any(cs in status_lower for cs in self.COMPLETED_STATUSES)
+        # まずO(1)の完全一致、次に部分一致（「対応済」などのため）
+        if status_lower in DiffAnalyzer._COMPLETED_SET:
+            return True
+        return any(cs in status_lower for cs in DiffAnalyzer.COMPLETED_STATUSES)
+
+    def _match_similar_tasks(
+        self,
+        task_names: list[str],
+        candidates: list[str],
+    ) -> dict[int, str]:
+        """
+        未マッチのタスク名を類似候補へ1対1で割り当てる
+
+        Args:
+            task_names: 現在のタスク名のリスト
+            candidates: 前回タスク名の候補リスト
+
+        Returns:
+            task_namesのインデックス → マッチした候補名の辞書
+        """
+        if not task_names or not candidates:
+            return {}
+
+        assignments: dict[int, str] = {}
+
+        if RAPIDFUZZ_AVAILABLE and NUMPY_AVAILABLE:
+            # 全ペアの類似度行列をC側で一括計算し、貪欲に割り当てる
+            scores = process.cdist(
+                task_names, candidates, scorer=fuzz.ratio, workers=-1
+            )
+            cutoff = self.SIMILARITY_THRESHOLD * 100
+            for i in range(scores.shape[0]):
+                j = int(scores[i].argmax())
+                if scores[i, j] >= cutoff:
+                    assignments[i] = candidates[j]
+                    scores[:, j] = 0  # 1対1割り当てを保証
+            return assignments
+
+        # フォールバック: 1件ずつ最良候補を探す
+        remaining = dict.fromkeys(candidates)
+        for i, name in enumerate(task_names):
+            match = self._find_similar_task(name, list(remaining))
+            if match:
+                assignments[i] = match
+                del remaining[match]
+        return assignments
 
     def _find_similar_task(
         self,
         task_name: str,
-        previous_tasks: list[str],
-        already_matched: set[str],
+        candidates: list[str],
     ) -> Optional[str]:
-        """類似タスクを探す"""
-        best_match = None
-        best_ratio = 0.0
+        """類似タスクを候補リストから探す
 
-        for prev_task in previous_tasks:
-            if prev_task in already_matched:
-                continue
-
-            ratio = SequenceMatcher(None, task_name, prev_task).ratio()
-            if ratio > best_ratio and ratio >= self.SIMILARITY_THRESHOLD:
-                best_ratio = ratio
-                best_match = prev_task
-
-        return best_match
+        呼び出し側がマッチ済みを除外した候補リストを渡す前提のため、
+        ここではマッチ済みチェックを行わない。
+        """
+        if not candidates:
+            return None
+
+        if RAPIDFUZZ_AVAILABLE:
+            match = process.extractOne(
+                task_name,
+                candidates,
+                scorer=fuzz.ratio,
+                score_cutoff=self.SIMILARITY_THRESHOLD * 100,
+            )
+            return match[0] if match else None
+
+        # get_close_matchesはquick ratioによる枝刈りで全ペアの
+        # 完全なSequenceMatcher計算を避ける
+        matches = get_close_matches(
+            task_name, candidates, n=1, cutoff=self.SIMILARITY_THRESHOLD
+        )
+        return matches[0] if matches else None
 
     def _add_to_result(self, result: DiffResult, change: TaskChange) -> None:
         """変更をresultに追加"""
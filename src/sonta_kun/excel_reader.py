@@ -2,14 +2,23 @@
 
 from dataclasses import dataclass, field
 from datetime import date, datetime
+from io import StringIO
+from itertools import chain, islice
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Optional
 
 from openpyxl import load_workbook
-from openpyxl.worksheet.worksheet import Worksheet
 
+# Rust実装のpython-calamineによる高速読み込みはオプション
+try:
+    from python_calamine import CalamineWorkbook
 
-@dataclass
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+
+@dataclass(slots=True)
 class TodoItem:
     """ToDoアイテム"""
 
@@ -32,13 +41,37 @@ class TodoItem:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TodoList:
     """ToDoリスト"""
 
     items: list[TodoItem] = field(default_factory=list)
     source_file: Optional[str] = None
 
+    @classmethod
+    def from_lines(
+        cls, lines: Iterable[str], source_file: Optional[str] = None
+    ) -> "TodoList":
+        """
+        テキスト行の並びからToDoリストを構築する
+
+        「タスク名 [ステータス] (優先度)」形式の行をパースし、
+        空行とタスク名が残らない行は読み飛ばす。
+
+        Args:
+            lines: テキスト行の並び
+            source_file: 入力元の表示名（オプション）
+
+        Returns:
+            構築したTodoList
+        """
+        items = [
+            item
+            for line in lines
+            if (stripped := line.strip()) and (item := _parse_todo_line(stripped))
+        ]
+        return cls(items=items, source_file=source_file)
+
     def to_dict(self) -> dict:
         """辞書形式に変換"""
         return {
@@ -48,21 +81,66 @@ class TodoList:
 
     def to_text(self) -> str:
         """テキスト形式に変換（AI入力用）"""
-        lines = []
+        buf = StringIO()
+        self.write_to(buf.write)
+        return buf.getvalue()
+
+    def write_to(self, write: Callable[[str], None]) -> None:
+        """
+        テキスト形式の内容をwriteコールバックへ直接書き出す
+
+        中間の巨大な文字列を作らずに、任意のシンク（StringIO、
+        ファイル、ウィジェット挿入など）へ流し込める。
+
+        Args:
+            write: テキスト断片を受け取るコールバック
+        """
         for i, item in enumerate(self.items, 1):
-            line = f"{i}. {item.task}"
+            if i > 1:
+                write("\n")
+            write(f"{i}. {item.task}")
             if item.status:
-                line += f" [{item.status}]"
+                write(f" [{item.status}]")
             if item.due_date:
-                line += f" (期限: {item.due_date})"
+                write(f" (期限: {item.due_date})")
             if item.priority:
-                line += f" 優先度: {item.priority}"
+                write(f" 優先度: {item.priority}")
             if item.category:
-                line += f" カテゴリ: {item.category}"
+                write(f" カテゴリ: {item.category}")
             if item.notes:
-                line += f"\n   備考: {item.notes}"
-            lines.append(line)
-        return "\n".join(lines)
+                write(f"\n   備考: {item.notes}")
+
+
+def _parse_todo_line(line: str) -> Optional[TodoItem]:
+    """1行をパースしてTodoItemを作成する（不正な行はNone）
+
+    正規表現エンジンを使わず、str.findのインデックス演算だけで
+    [ステータス] と (優先度) を取り出す。Matchオブジェクトの割り当てが
+    ないぶん、大量ペースト時のパースが速い。
+    """
+    # ステータス [xxx] を抽出し、スライス連結で取り除く
+    lb = line.find("[")
+    rb = line.find("]", lb + 1) if lb >= 0 else -1
+    if rb > lb + 1:
+        status = line[lb + 1 : rb]
+        task = line[:lb] + line[rb + 1 :]
+    else:
+        status = ""
+        task = line
+
+    # 優先度 (xxx) も同様に抽出・除去する
+    lp = task.find("(")
+    rp = task.find(")", lp + 1) if lp >= 0 else -1
+    if rp > lp + 1:
+        priority = task[lp + 1 : rp]
+        task = task[:lp] + task[rp + 1 :]
+    else:
+        priority = ""
+
+    task = task.strip()
+    if task:
+        return TodoItem(task=task, status=status, priority=priority)
+    return None
 
 
 class ExcelReader:
@@ -78,6 +156,13 @@ class ExcelReader:
         "notes": ["備考", "notes", "メモ", "コメント", "詳細"],
     }
 
+    # 小文字化したエイリアス → フィールド名の事前計算済みマッピング
+    _ALIAS_TO_FIELD = {
+        alias.lower(): field_name
+        for field_name, aliases in COLUMN_MAPPINGS.items()
+        for alias in aliases
+    }
+
     def __init__(self):
         self._column_indices: dict[str, int] = {}
 
@@ -103,13 +188,16 @@ class ExcelReader:
             raise ExcelReadError(f"サポートされていないファイル形式です: {path.suffix}")
 
         try:
-            workbook = load_workbook(path, read_only=True, data_only=True)
-            sheet = workbook.active
-
-            if sheet is None:
-                raise ExcelReadError("アクティブなシートが見つかりません")
-
-            items = self._parse_sheet(sheet)
+            if CALAMINE_AVAILABLE:
+                try:
+                    items = self._read_with_calamine(path)
+                except ExcelReadError:
+                    raise
+                except Exception:
+                    # calamineが扱えない形式はopenpyxlで再試行
+                    items = self._read_with_openpyxl(path)
+            else:
+                items = self._read_with_openpyxl(path)
 
             return TodoList(items=items, source_file=str(path))
 
@@ -118,25 +206,46 @@ class ExcelReader:
         except Exception as e:
             raise ExcelReadError(f"Excelファイルの読み込みに失敗しました: {e}") from e
 
-    def _parse_sheet(self, sheet: Worksheet) -> list[TodoItem]:
-        """シートをパースしてTodoItemのリストを返す"""
-        rows = list(sheet.iter_rows(values_only=True))
+    def _read_with_calamine(self, path: Path) -> list[TodoItem]:
+        """python-calamine（Rust実装）でシートを読み込む"""
+        workbook = CalamineWorkbook.from_path(str(path))
+        sheet = workbook.get_sheet_by_index(0)
+        return self._parse_rows(sheet.to_python())
 
-        if not rows:
+    def _read_with_openpyxl(self, path: Path) -> list[TodoItem]:
+        """openpyxlでシートを読み込む"""
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        sheet = workbook.active
+
+        if sheet is None:
+            raise ExcelReadError("アクティブなシートが見つかりません")
+
+        return self._parse_rows(sheet.iter_rows(values_only=True))
+
+    # ヘッダー検出の対象とする先頭行数
+    HEADER_SEARCH_ROWS = 10
+
+    def _parse_rows(self, rows: Iterable[tuple]) -> list[TodoItem]:
+        """行の並びをパースしてTodoItemのリストを返す"""
+        # 全行をリスト化せず、ヘッダー検出に必要な先頭行だけ先読みする
+        rows_iter = iter(rows)
+        head = list(islice(rows_iter, self.HEADER_SEARCH_ROWS))
+
+        if not head:
             return []
 
         # ヘッダー行を検出
-        header_row_idx = self._find_header_row(rows)
+        header_row_idx = self._find_header_row(head)
         if header_row_idx is None:
             # ヘッダーがない場合は1列目をタスクとして扱う
-            return self._parse_without_header(rows)
+            return self._parse_without_header(chain(head, rows_iter))
 
-        headers = rows[header_row_idx]
+        headers = head[header_row_idx]
         self._map_columns(headers)
 
-        # データ行をパース
+        # データ行をストリームのままパース
         items = []
-        for row in rows[header_row_idx + 1 :]:
+        for row in chain(head[header_row_idx + 1 :], rows_iter):
             item = self._parse_row(row)
             if item:
                 items.append(item)
@@ -145,7 +254,7 @@ class ExcelReader:
 
     def _find_header_row(self, rows: list[tuple]) -> Optional[int]:
         """ヘッダー行のインデックスを見つける"""
-        for idx, row in enumerate(rows[:10]):  # 最初の10行を検索
+        for idx, row in enumerate(rows[: self.HEADER_SEARCH_ROWS]):
             if row and any(self._is_header_cell(cell) for cell in row if cell):
                 return idx
         return None
@@ -154,11 +263,7 @@ class ExcelReader:
         """セルがヘッダーかどうかを判定"""
         if not isinstance(value, str):
             return False
-        value_lower = value.lower().strip()
-        for field_names in self.COLUMN_MAPPINGS.values():
-            if value_lower in [name.lower() for name in field_names]:
-                return True
-        return False
+        return value.lower().strip() in self._ALIAS_TO_FIELD
 
     def _map_columns(self, headers: tuple) -> None:
         """ヘッダーからカラムインデックスをマッピング"""
@@ -166,11 +271,9 @@ class ExcelReader:
         for idx, header in enumerate(headers):
             if not header:
                 continue
-            header_lower = str(header).lower().strip()
-            for field_name, aliases in self.COLUMN_MAPPINGS.items():
-                if header_lower in [alias.lower() for alias in aliases]:
-                    self._column_indices[field_name] = idx
-                    break
+            field_name = self._ALIAS_TO_FIELD.get(str(header).lower().strip())
+            if field_name is not None:
+                self._column_indices[field_name] = idx
 
     def _parse_row(self, row: tuple) -> Optional[TodoItem]:
         """行をパースしてTodoItemを返す"""
@@ -199,7 +302,7 @@ class ExcelReader:
             notes=self._get_cell_value(row, "notes"),
         )
 
-    def _parse_without_header(self, rows: list[tuple]) -> list[TodoItem]:
+    def _parse_without_header(self, rows: Iterable[tuple]) -> list[TodoItem]:
         """ヘッダーなしでパースする（1列目をタスクとして扱う）"""
         items = []
         for row in rows:
@@ -1,5 +1,6 @@
 """ファイル操作ハンドラーモジュール"""
 
+import atexit
 import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog
@@ -14,6 +15,32 @@ except ImportError:
     DND_AVAILABLE = False
 
 
+# ファイルダイアログ用に使い回す非表示のTkルート
+# （Tk初期化は100ms超かかるため、呼び出しごとの生成・破棄を避ける）
+_DIALOG_ROOT: Optional[tk.Tk] = None
+
+
+def _get_dialog_root() -> tk.Tk:
+    """非表示のダイアログ用Tkルートを取得する（初回のみ生成）"""
+    global _DIALOG_ROOT
+    if _DIALOG_ROOT is None:
+        _DIALOG_ROOT = tk.Tk()
+        _DIALOG_ROOT.withdraw()
+        atexit.register(_destroy_dialog_root)
+    return _DIALOG_ROOT
+
+
+def _destroy_dialog_root() -> None:
+    """ダイアログ用Tkルートを破棄する（プロセス終了時）"""
+    global _DIALOG_ROOT
+    if _DIALOG_ROOT is not None:
+        try:
+            _DIALOG_ROOT.destroy()
+        except tk.TclError:
+            pass
+        _DIALOG_ROOT = None
+
+
 class FileSelector:
     """ファイル選択クラス（ダイアログ＆D&D対応）"""
 
@@ -33,17 +60,16 @@ class FileSelector:
         Returns:
             選択されたファイルのPath、キャンセル時はNone
         """
-        root = tk.Tk()
-        root.withdraw()
+        root = _get_dialog_root()
 
         filetypes = [
             ("Excel ファイル", "*.xlsx *.xls *.xlsm"),
             ("すべてのファイル", "*.*"),
         ]
 
-        file_path = filedialog.askopenfilename(title=title, filetypes=filetypes)
-
-        root.destroy()
+        file_path = filedialog.askopenfilename(
+            parent=root, title=title, filetypes=filetypes
+        )
 
         if file_path:
             path = Path(file_path)
@@ -1,8 +1,13 @@
 """メインウィンドウモジュール"""
 
+from __future__ import annotations
+
+import os
+import threading
 import tkinter as tk
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 try:
     import ttkbootstrap as ttk
@@ -17,15 +22,29 @@ except ImportError:
 from tkinter import filedialog, messagebox
 
 from ..config import AppConfig
-from ..excel_reader import ExcelReader, ExcelReadError, TodoItem, TodoList
-from ..output_formatter import OutputFormat, OutputFormatter
-from ..profile_manager import ProfileManager, TargetProfile
-from ..report_generator import GeneratedReport, ReportGenerationError, ReportGenerator
+from ..profile_manager import ProfileManager
+
+# 重量級モジュール（openpyxl、boto3経由）は起動を遅くしないよう
+# 初回使用時に遅延importする
+if TYPE_CHECKING:
+    from ..excel_reader import ExcelReader, TodoList
+    from ..output_formatter import OutputFormatter
+    from ..profile_manager import TargetProfile
+    from ..report_generator import GeneratedReport, ReportGenerator
+
+__all__ = ["MainWindow"]
 
 
 class MainWindow:
     """SONTA-kun メインウィンドウ"""
 
+    # Excel読み込み結果キャッシュの上限
+    _EXCEL_CACHE_MAX = 8
+
+    # これを超えるテキストはafter_idleで分割挿入する（UIを固めないため）
+    _CHUNK_INSERT_THRESHOLD = 200_000
+    _CHUNK_SIZE = 65_536
+
     def __init__(self):
         if MODERN_UI:
             self._root = ttk.Window(
@@ -40,19 +59,53 @@ class MainWindow:
             self._root.geometry("1000x800")
             self._root.minsize(900, 700)
 
-        # 依存モジュール
+        # 依存モジュール（重量級のものは初回使用時に生成）
         self._config = AppConfig.load()
         self._profile_manager = ProfileManager()
-        self._excel_reader = ExcelReader()
-        self._formatter = OutputFormatter()
+
+        # プロファイルのGUI側キャッシュ
+        # （生成クリックごとのManager照会を避ける。設定画面を閉じたときに再構築）
+        self._profile_cache = {
+            p.name: p for p in self._profile_manager.list_profiles()
+        }
+        self._excel_reader: Optional[ExcelReader] = None
+        self._formatter: Optional[OutputFormatter] = None
         self._generator: Optional[ReportGenerator] = None
+        self._generator_lock = threading.Lock()
+
+        # Excel読み込み結果のLRUキャッシュ
+        # （同一ファイルの再選択でXLSXパースをやり直さないため）
+        self._excel_cache: OrderedDict[tuple, TodoList] = OrderedDict()
 
         # 状態
         self._current_todo_list: Optional[TodoList] = None
         self._generated_report: Optional[GeneratedReport] = None
+        # 生成の多重起動ガード（ショートカットはボタンの無効化を迂回する）
+        self._generating: bool = False
         self._input_mode: str = "excel"  # "excel" or "freetext"
+        self._tab_change_token: Optional[str] = None
+        self._insert_generation: int = 0
 
+        # 構築中のウィジェットごとの再描画を避け、レイアウト計算を
+        # 最後の1回にまとめる
+        self._root.withdraw()
         self._setup_ui()
+        self._root.update_idletasks()
+        self._root.deiconify()
+
+        # 初回クリック時のboto3クライアント生成コストを先払いしておく
+        threading.Thread(target=self._warm_generator, daemon=True).start()
+
+    def _warm_generator(self) -> None:
+        """ReportGeneratorをバックグラウンドで事前初期化する
+
+        失敗しても無視する（オフライン等）。その場合は生成時に
+        _get_generatorが改めて構築を試みる。
+        """
+        try:
+            self._get_generator()
+        except Exception:
+            pass
 
     def _setup_ui(self) -> None:
         """UIをセットアップ"""
@@ -75,6 +128,12 @@ class MainWindow:
 
         self._setup_output_panel(right_frame)
 
+        # キーボードショートカット（ルートで1回だけバインドする）
+        self._root.bind_all("<Control-g>", lambda e: self._generate_report())
+        self._root.bind_all("<Control-s>", lambda e: self._save_output())
+        self._root.bind_all("<Control-Shift-C>", lambda e: self._copy_output())
+        self._root.bind_all("<Control-l>", lambda e: self._clear_output())
+
     def _setup_header(self) -> None:
         """ヘッダーをセットアップ"""
         header_frame = ttk.Frame(self._root, padding=(15, 10))
@@ -148,7 +207,7 @@ class MainWindow:
         target_frame.pack(fill=tk.X, pady=5)
         ttk.Label(target_frame, text="報告対象者:", width=12).pack(side=tk.LEFT)
         self._target_var = tk.StringVar()
-        profile_names = self._profile_manager.get_profile_names()
+        profile_names = list(self._profile_cache)
         self._target_combo = ttk.Combobox(
             target_frame, textvariable=self._target_var,
             values=profile_names, state="readonly", bootstyle="primary"
@@ -190,9 +249,15 @@ class MainWindow:
         self._notes_text = ScrolledText(notes_frame, height=3, autohide=True)
         self._notes_text.pack(fill=tk.BOTH, expand=True)
 
+        # 生成中インジケーター
+        self._progress_bar = ttk.Progressbar(
+            parent, mode="indeterminate", bootstyle="success-striped"
+        )
+        self._progress_bar.pack(fill=tk.X, pady=(0, 5))
+
         # 生成ボタン
         self._generate_btn = ttk.Button(
-            parent, text="報告書を生成", command=self._generate_report,
+            parent, text="報告書を生成 (Ctrl+G)", command=self._generate_report,
             bootstyle="success", width=20
         )
         self._generate_btn.pack(pady=5)
@@ -217,7 +282,7 @@ class MainWindow:
         preview_label = ttk.Label(parent, text="読み込み内容:", bootstyle="secondary")
         preview_label.pack(anchor=tk.W, pady=(5, 5))
 
-        self._excel_preview_text = ScrolledText(parent, height=10, autohide=True)
+        self._excel_preview_text = ScrolledText(parent, height=10, autohide=True, wrap="none")
         self._excel_preview_text.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         self._excel_preview_text.text.config(state=tk.DISABLED)
 
@@ -272,7 +337,14 @@ class MainWindow:
         ).pack(side=tk.RIGHT, padx=(0, 5))
 
     def _on_tab_changed(self, event) -> None:
-        """タブ切り替え時の処理"""
+        """タブ切り替え時の処理（連続発火はafter_idleで最後の1回に集約）"""
+        if self._tab_change_token is not None:
+            self._root.after_cancel(self._tab_change_token)
+        self._tab_change_token = self._root.after_idle(self._apply_tab_change)
+
+    def _apply_tab_change(self) -> None:
+        """タブ切り替えを反映する（アイドル時に実行）"""
+        self._tab_change_token = None
         selected_tab = self._input_notebook.index(self._input_notebook.select())
         self._input_mode = "excel" if selected_tab == 0 else "freetext"
 
@@ -285,8 +357,8 @@ GUI実装 [進行中] (高)
 テスト作成 [進行中] (中)
 ドキュメント作成 [未着手] (低)
 コードレビュー [未着手] (中)"""
-        self._freetext_input.text.delete("1.0", tk.END)
-        self._freetext_input.text.insert("1.0", sample)
+        # delete+insertの2回リフローを避けて1回のreplaceで書き換える
+        self._freetext_input.text.replace("1.0", tk.END, sample)
 
     def _clear_freetext(self) -> None:
         """自由記述をクリア"""
@@ -314,51 +386,23 @@ GUI実装 [進行中] (高)
             messagebox.showwarning("警告", "ToDoアイテムを入力してください")
             return
 
-        items = []
-        for line in text.split("\n"):
-            line = line.strip()
-            if not line:
-                continue
+        from ..excel_reader import TodoList
 
-            item = self._parse_todo_line(line)
-            if item:
-                items.append(item)
+        # パースはTodoList側に集約されたホットパスに任せる
+        todo_list = TodoList.from_lines(text.splitlines(), source_file="自由記述")
 
-        if items:
-            self._current_todo_list = TodoList(items=items, source_file="自由記述")
-            self._status_label.config(text=f"読み込み完了: {len(items)}件のタスク")
+        if todo_list.items:
+            self._current_todo_list = todo_list
+            self._status_label.config(
+                text=f"読み込み完了: {len(todo_list.items)}件のタスク"
+            )
         else:
             messagebox.showwarning("警告", "有効なToDoアイテムが見つかりません")
 
-    def _parse_todo_line(self, line: str) -> Optional[TodoItem]:
-        """1行をパースしてTodoItemを作成"""
-        import re
-
-        task = line
-        status = ""
-        priority = ""
-
-        # ステータスを抽出 [xxx]
-        status_match = re.search(r'\[([^\]]+)\]', line)
-        if status_match:
-            status = status_match.group(1)
-            task = task.replace(status_match.group(0), "")
-
-        # 優先度を抽出 (xxx)
-        priority_match = re.search(r'\(([^)]+)\)', task)
-        if priority_match:
-            priority = priority_match.group(1)
-            task = task.replace(priority_match.group(0), "")
-
-        task = task.strip()
-        if task:
-            return TodoItem(task=task, status=status, priority=priority)
-        return None
-
     def _setup_output_panel(self, parent: ttk.Frame) -> None:
         """出力パネルをセットアップ"""
         # 出力テキスト
-        self._output_text = ScrolledText(parent, autohide=True)
+        self._output_text = ScrolledText(parent, autohide=True, wrap="none")
         self._output_text.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
 
         # ボタン
@@ -393,23 +437,121 @@ GUI実装 [進行中] (高)
             self._load_excel_file(file_path)
 
     def _load_excel_file(self, file_path: str) -> None:
-        """Excelファイルを読み込む"""
+        """Excelファイルを読み込む（未変更ファイルはキャッシュから再利用）"""
+        from ..excel_reader import ExcelReadError
+
         try:
-            self._current_todo_list = self._excel_reader.read(file_path)
+            self._current_todo_list = self._read_excel_cached(file_path)
             self._status_label.config(text=f"読み込み完了: {len(self._current_todo_list.items)}件のタスク")
 
             # プレビュー表示
-            self._excel_preview_text.text.config(state=tk.NORMAL)
-            self._excel_preview_text.text.delete("1.0", tk.END)
-            self._excel_preview_text.text.insert("1.0", self._current_todo_list.to_text())
-            self._excel_preview_text.text.config(state=tk.DISABLED)
+            self._update_preview(self._current_todo_list.to_text())
 
-        except ExcelReadError as e:
+        except (OSError, ExcelReadError) as e:
             messagebox.showerror("エラー", f"ファイル読み込みエラー:\n{e}")
             self._status_label.config(text="読み込み失敗")
 
+    def _update_preview(self, text: str) -> None:
+        """Excelプレビューを更新する（大きな内容は分割挿入でUIを固めない）
+
+        プレビューウィジェットが未構築の場合（ヘッドレスでの部分利用など）
+        は何もしない。
+        """
+        if not hasattr(self, "_excel_preview_text"):
+            return
+        preview = self._excel_preview_text.text
+        preview.config(state=tk.NORMAL)
+        self._set_text_content(preview, text, disable_after=True)
+
+    def _set_text_content(
+        self, widget: tk.Text, content: str, disable_after: bool = False
+    ) -> None:
+        """Textウィジェットの内容を差し替える
+
+        閾値を超える内容はafter_idleで分割挿入し、mainloopに制御を
+        返しながら段階的に描画する。途中で別の差し替えが始まった場合、
+        世代カウンターの不一致で古い挿入は打ち切られる。
+
+        Args:
+            widget: 対象のTextウィジェット
+            content: 新しい内容
+            disable_after: 挿入完了後にstateをDISABLEDへ戻すか
+        """
+        self._insert_generation += 1
+
+        if len(content) <= self._CHUNK_INSERT_THRESHOLD:
+            widget.replace("1.0", tk.END, content)
+            widget.edit_reset()
+            if disable_after:
+                widget.config(state=tk.DISABLED)
+            return
+
+        widget.replace("1.0", tk.END, "")
+        self._insert_chunk(
+            widget, content, 0, self._insert_generation, disable_after
+        )
+
+    def _insert_chunk(
+        self,
+        widget: tk.Text,
+        content: str,
+        offset: int,
+        generation: int,
+        disable_after: bool,
+    ) -> None:
+        """分割挿入の1チャンクを処理する（アイドル時に継続）"""
+        if generation != self._insert_generation:
+            return
+
+        next_offset = offset + self._CHUNK_SIZE
+        widget.insert(tk.END, content[offset:next_offset])
+
+        if next_offset < len(content):
+            self._root.after_idle(
+                self._insert_chunk,
+                widget,
+                content,
+                next_offset,
+                generation,
+                disable_after,
+            )
+        else:
+            widget.edit_reset()
+            if disable_after:
+                widget.config(state=tk.DISABLED)
+
+    def _read_excel_cached(self, file_path: str) -> TodoList:
+        """ExcelファイルをLRUキャッシュ経由で読み込む
+
+        キーにmtimeとサイズを含めるため、ファイルが更新されていれば
+        自動的に読み直す。
+
+        Args:
+            file_path: Excelファイルのパス
+
+        Returns:
+            読み込んだToDoリスト
+        """
+        st = os.stat(file_path)
+        key = (file_path, st.st_mtime_ns, st.st_size)
+
+        cached = self._excel_cache.get(key)
+        if cached is not None:
+            self._excel_cache.move_to_end(key)
+            return cached
+
+        todo_list = self._get_excel_reader().read(file_path)
+        self._excel_cache[key] = todo_list
+        while len(self._excel_cache) > self._EXCEL_CACHE_MAX:
+            self._excel_cache.popitem(last=False)
+        return todo_list
+
     def _generate_report(self) -> None:
         """報告書を生成"""
+        # Ctrl+Gは無効化されたボタンを迂回するため、ここでも多重起動を防ぐ
+        if self._generating:
+            return
+
         # 自由記述モードの場合、先に読み込み
         if self._input_mode == "freetext" and not self._current_todo_list:
             self._load_freetext()
@@ -426,7 +568,7 @@ GUI実装 [進行中] (高)
             messagebox.showwarning("警告", "報告対象者を選択してください")
             return
 
-        profile = self._profile_manager.get_profile(target_name)
+        profile = self._profile_cache.get(target_name)
         if not profile:
             messagebox.showerror("エラー", f"プロファイル '{target_name}' が見つかりません")
             return
@@ -435,51 +577,131 @@ GUI実装 [進行中] (高)
         prev_report = self._prev_report_text.text.get("1.0", tk.END).strip() or None
         notes = self._notes_text.text.get("1.0", tk.END).strip() or None
 
-        # 生成開始
+        # 生成開始（Bedrock呼び出しはバックグラウンドスレッドで実行し、
+        # mainloopをブロックしない）
+        self._generating = True
         self._status_label.config(text="生成中...")
         self._generate_btn.config(state=tk.DISABLED)
-        self._root.update()
+        self._root.configure(cursor="watch")
+        self._progress_bar.start(10)
+
+        worker = threading.Thread(
+            target=self._run_generate,
+            args=(
+                self._current_todo_list,
+                profile,
+                self._report_type_var.get(),
+                prev_report,
+                notes,
+                self._format_var.get(),
+                target_name,
+            ),
+            daemon=True,
+        )
+        worker.start()
 
-        try:
+    def _get_generator(self) -> ReportGenerator:
+        """ReportGeneratorを取得する（初回のみimportと生成、スレッドセーフ）"""
+        with self._generator_lock:
             if self._generator is None:
+                from ..report_generator import ReportGenerator
+
                 self._generator = ReportGenerator(
                     self._config.bedrock,
                     self._profile_manager,
                 )
+            return self._generator
+
+    def _get_excel_reader(self) -> ExcelReader:
+        """ExcelReaderを取得する（初回のみimportと生成）"""
+        if self._excel_reader is None:
+            from ..excel_reader import ExcelReader
+
+            self._excel_reader = ExcelReader()
+        return self._excel_reader
+
+    def _get_formatter(self) -> OutputFormatter:
+        """OutputFormatterを取得する（初回のみimportと生成）"""
+        if self._formatter is None:
+            from ..output_formatter import OutputFormatter
+
+            self._formatter = OutputFormatter()
+        return self._formatter
+
+    def _run_generate(
+        self,
+        todo_list: TodoList,
+        profile: TargetProfile,
+        report_type: str,
+        prev_report: Optional[str],
+        notes: Optional[str],
+        format_name: str,
+        target_name: str,
+    ) -> None:
+        """報告書生成のワーカー処理（バックグラウンドスレッドで実行）"""
+        from ..output_formatter import OutputFormat
+        from ..report_generator import ReportGenerationError
 
-            self._generated_report = self._generator.generate(
-                todo_list=self._current_todo_list,
+        try:
+            generator = self._get_generator()
+            report = generator.generate(
+                todo_list=todo_list,
                 target_profile=profile,
-                report_type=self._report_type_var.get(),
+                report_type=report_type,
                 previous_report=prev_report,
                 additional_notes=notes,
                 save_report=True,
             )
 
             # 出力をフォーマット
-            output_format = OutputFormat.MARKDOWN if self._format_var.get() == "markdown" else OutputFormat.TEXT
-            formatted = self._formatter.format(
-                self._generated_report,
+            output_format = OutputFormat.MARKDOWN if format_name == "markdown" else OutputFormat.TEXT
+            formatted = self._get_formatter().format(
+                report,
                 output_format=output_format,
-                report_type=self._report_type_var.get(),
+                report_type=report_type,
                 target_name=target_name,
             )
 
-            # 出力表示
-            self._output_text.text.delete("1.0", tk.END)
-            self._output_text.text.insert("1.0", formatted.full_report)
-
-            self._status_label.config(text="生成完了")
+            # UI更新はメインスレッドへマーシャリング
+            self._root.after(0, self._apply_report, report, formatted.full_report)
 
         except ReportGenerationError as e:
-            messagebox.showerror("エラー", f"報告書生成エラー:\n{e}")
-            self._status_label.config(text="生成失敗")
-        finally:
-            self._generate_btn.config(state=tk.NORMAL)
+            self._root.after(0, self._show_generate_error, e)
+        except Exception as e:
+            # 想定外の例外もデーモンスレッド内で握りつぶさず、エラー表示と
+            # ボタン・カーソルの復帰をメインスレッドで必ず行う
+            self._root.after(0, self._show_generate_error, e)
+
+    def _apply_report(self, report: GeneratedReport, full_report: str) -> None:
+        """生成結果をUIへ反映する（メインスレッドで実行）"""
+        self._generated_report = report
+
+        self._set_text_content(self._output_text.text, full_report)
+
+        self._status_label.config(text="生成完了")
+        self._finish_generate()
+
+    def _show_generate_error(self, error: Exception) -> None:
+        """生成エラーを表示する（メインスレッドで実行）"""
+        messagebox.showerror("エラー", f"報告書生成エラー:\n{error}")
+        self._status_label.config(text="生成失敗")
+        self._finish_generate()
+
+    def _finish_generate(self) -> None:
+        """生成の後始末（インジケーター停止とボタン・カーソル復帰）"""
+        self._generating = False
+        self._progress_bar.stop()
+        self._root.configure(cursor="")
+        self._generate_btn.config(state=tk.NORMAL)
 
     def _copy_output(self) -> None:
         """出力をクリップボードにコピー"""
-        content = self._output_text.text.get("1.0", tk.END).strip()
+        # 生成途中の中身をコピーしない
+        if self._generating:
+            return
+
+        # end-1cで末尾の自動改行を除き、.strip()の再割り当てを避ける
+        content = self._output_text.text.get("1.0", "end-1c")
         if content:
             self._root.clipboard_clear()
             self._root.clipboard_append(content)
@@ -487,7 +709,11 @@ GUI実装 [進行中] (高)
 
     def _save_output(self) -> None:
         """出力をファイルに保存"""
-        content = self._output_text.text.get("1.0", tk.END).strip()
+        # 生成途中の中身を保存しない
+        if self._generating:
+            return
+
+        content = self._output_text.text.get("1.0", "end-1c")
         if not content:
             messagebox.showwarning("警告", "保存する内容がありません")
             return
@@ -503,9 +729,11 @@ GUI実装 [進行中] (高)
             filetypes=filetypes,
         )
         if file_path:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
-            self._status_label.config(text=f"保存完了: {Path(file_path).name}")
+            # 1回のwriteで書き出す（open＋writeの往復を省く）。
+            # プラットフォームの改行変換を保つためwrite_textを使う
+            path = Path(file_path)
+            path.write_text(content, encoding="utf-8")
+            self._status_label.config(text=f"保存完了: {path.name}")
 
     def _clear_output(self) -> None:
         """出力をクリア"""
@@ -517,9 +745,14 @@ GUI実装 [進行中] (高)
         from .settings_window import SettingsWindow
         settings = SettingsWindow(self._root, self._profile_manager)
         self._root.wait_window(settings.window)
-        # プロファイルリストを更新
-        profile_names = self._profile_manager.get_profile_names()
-        self._target_combo.config(values=profile_names)
+        # プロファイルキャッシュを再構築し、リストを更新
+        # （変化がなければTclへの往復を省く）
+        self._profile_cache = {
+            p.name: p for p in self._profile_manager.list_profiles()
+        }
+        profile_names = list(self._profile_cache)
+        if tuple(profile_names) != tuple(self._target_combo.cget("values")):
+            self._target_combo.config(values=profile_names)
 
     def run(self) -> None:
         """アプリケーションを実行"""
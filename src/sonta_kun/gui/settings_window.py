@@ -1,6 +1,7 @@
 """設定画面モジュール"""
 
 import tkinter as tk
+from difflib import SequenceMatcher
 from typing import Optional
 
 try:
@@ -15,6 +16,8 @@ from tkinter import messagebox
 
 from ..profile_manager import ProfileManager, TargetProfile
 
+__all__ = ["SettingsWindow"]
+
 
 class SettingsWindow:
     """設定画面（プロファイル管理）"""
@@ -37,6 +40,16 @@ class SettingsWindow:
 
         self._selected_profile: Optional[TargetProfile] = None
 
+        # 表示文字列と並行して保持する名前リスト
+        # （選択のたびに表示文字列を再パースしないため）
+        self._profile_names: list[str] = []
+
+        # 選択イベントのデバウンス用トークン
+        self._select_after_id: Optional[str] = None
+
+        # Listboxに表示中の文字列（差分更新用）
+        self._displayed: list[str] = []
+
         self._setup_ui()
         self._load_profiles()
 
@@ -198,20 +211,48 @@ class SettingsWindow:
         ).pack(side=tk.LEFT)
 
     def _load_profiles(self) -> None:
-        """プロファイルリストを読み込む"""
-        self._profile_listbox.delete(0, tk.END)
-        for profile in self._profile_manager.list_profiles():
-            self._profile_listbox.insert(tk.END, f"  {profile.name}  ({profile.role})")
+        """プロファイルリストを読み込む（変更行だけをListboxへ反映する）"""
+        profiles = self._profile_manager.list_profiles()
+        self._profile_names = [profile.name for profile in profiles]
+        items = [f"  {profile.name}  ({profile.role})" for profile in profiles]
+
+        if items == self._displayed:
+            return
+
+        # 全消去＋全再挿入ではなく、差分のinsert/deleteだけを発行する
+        # （1件の保存・削除ならTcl呼び出しも1回で済む）
+        offset = 0
+        matcher = SequenceMatcher(a=self._displayed, b=items, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                continue
+            pos = i1 + offset
+            if tag in ("replace", "delete"):
+                self._profile_listbox.delete(pos, pos + (i2 - i1) - 1)
+            if tag in ("replace", "insert"):
+                self._profile_listbox.insert(pos, *items[j1:j2])
+            offset += (j2 - j1) - (i2 - i1)
+
+        self._displayed = items
 
     def _on_profile_select(self, event) -> None:
-        """プロファイル選択時の処理"""
+        """プロファイル選択時の処理
+
+        矢印キーの押しっぱなし等で連続発火するため、80ms以内の
+        連続イベントは最後の1回だけフォームへ反映する。
+        """
+        if self._select_after_id is not None:
+            self._window.after_cancel(self._select_after_id)
+        self._select_after_id = self._window.after(80, self._load_selected_profile)
+
+    def _load_selected_profile(self) -> None:
+        """現在の選択をフォームへ読み込む（デバウンス後に実行）"""
+        self._select_after_id = None
         selection = self._profile_listbox.curselection()
         if not selection:
             return
 
-        # リストから名前を抽出
-        item_text = self._profile_listbox.get(selection[0])
-        name = item_text.split("(")[0].strip()
+        name = self._profile_names[selection[0]]
 
         profile = self._profile_manager.get_profile(name)
         if profile:
@@ -265,9 +306,12 @@ class SettingsWindow:
         self._load_profiles()
 
         # 保存したプロファイルを選択
-        names = self._profile_manager.get_profile_names()
-        if name in names:
-            idx = names.index(name)
+        # （containsとindexの2回走査を避け、1回のindexで位置を求める）
+        try:
+            idx = self._profile_names.index(name)
+        except ValueError:
+            idx = None
+        if idx is not None:
             self._profile_listbox.selection_clear(0, tk.END)
             self._profile_listbox.selection_set(idx)
 
@@ -292,8 +336,7 @@ class SettingsWindow:
             messagebox.showwarning("警告", "削除するプロファイルを選択してください")
             return
 
-        item_text = self._profile_listbox.get(selection[0])
-        name = item_text.split("(")[0].strip()
+        name = self._profile_names[selection[0]]
 
         if messagebox.askyesno("確認", f"プロファイル '{name}' を削除しますか？"):
             self._profile_manager.delete_profile(name)
@@ -1,15 +1,45 @@
 """出力フォーマッターモジュール"""
 
+from __future__ import annotations
+
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+# クリップボード連携はオプション
+try:
+    import pyperclip as _pyperclip
+except ImportError:
+    _pyperclip = None
+
+if TYPE_CHECKING:
+    # GeneratedReportは注釈にしか使わないため実行時には読み込まない
+    # （report_generator経由でbedrock_client・boto3まで連鎖するのを防ぐ）
+    from .report_generator import GeneratedReport
+
+# 文末候補の句点を「。」へ正規化する変換テーブル（_truncate_text用）
+_SENT_END_TABLE = str.maketrans("．.", "。。")
 
-from .report_generator import GeneratedReport
+# 報告タイプ → 表示ラベル
+_REPORT_TYPE_LABELS = {"weekly": "週報", "monthly": "月報"}
 
 
-class OutputFormat(Enum):
-    """出力形式"""
+@lru_cache(maxsize=1)
+def _date_label(d: date) -> str:
+    """日付の表示文字列を返す（同日内のバッチ生成では1回だけstrftimeする）"""
+    return d.strftime("%Y年%m月%d日")
+
+
+class OutputFormat(str, Enum):
+    """出力形式
+
+    strを継承しているため、プロファイル由来の素の文字列
+    （"markdown"など）ともC速度の文字列比較で直接照合できる。
+    """
 
     TEXT = "text"
     MARKDOWN = "markdown"
@@ -29,6 +59,15 @@ class FormattedOutput:
 class OutputFormatter:
     """報告書の出力をフォーマットするクラス"""
 
+    # 静的な定型文字列（format呼び出しごとの再構築を避ける）
+    _MD_SUMMARY_HDR = "## エグゼクティブサマリ\n\n"
+    _MD_DETAILS_HDR = "## 詳細内容\n\n"
+    _MD_ACTIONS_HDR = "## ネクストアクション\n\n"
+    _TEXT_SUMMARY_HDR = "【エグゼクティブサマリ】\n"
+    _TEXT_DETAILS_HDR = "【詳細内容】\n"
+    _TEXT_ACTIONS_HDR = "【ネクストアクション】\n"
+    _TEXT_SEP = "=" * 50
+
     def __init__(self, max_summary_chars: int = 300):
         """
         Args:
@@ -64,39 +103,39 @@ class OutputFormatter:
         self, report: GeneratedReport, report_type: str, target_name: str
     ) -> FormattedOutput:
         """Markdown形式でフォーマット"""
-        report_type_text = "週報" if report_type == "weekly" else "月報"
-        date_str = datetime.now().strftime("%Y年%m月%d日")
+        report_type_text = _REPORT_TYPE_LABELS.get(report_type, "週報")
+        date_str = _date_label(datetime.now().date())
 
         # エグゼクティブサマリ（文字数制御）
         summary = self._truncate_text(
             report.executive_summary, self._max_summary_chars
         )
-        summary_section = f"## エグゼクティブサマリ\n\n{summary}"
-
-        # 詳細内容
-        details_section = f"## 詳細内容\n\n{report.details}"
-
         # ネクストアクション
+        # （str.joinはリスト入力で内部のシーケンス化を省ける）
         next_actions_list = "\n".join(
-            f"- {action}" for action in report.next_actions
+            [f"- {action}" for action in report.next_actions]
         )
-        next_actions_section = f"## ネクストアクション\n\n{next_actions_list}"
 
-        # フルレポート
+        # ヘッダー
         header = f"# {report_type_text}"
         if target_name:
             header += f"（{target_name}向け）"
         header += f"\n\n**作成日**: {date_str}\n"
 
-        full_report = "\n\n".join(
-            [header, summary_section, details_section, next_actions_section]
-        )
+        # 各セクションを1つのリストに組み立て、そのままjoinと
+        # 戻り値の両方に使う（中間変数の個別割り当てを省く）
+        parts = [
+            header,
+            self._MD_SUMMARY_HDR + summary,
+            self._MD_DETAILS_HDR + report.details,
+            self._MD_ACTIONS_HDR + next_actions_list,
+        ]
 
         return FormattedOutput(
-            executive_summary=summary_section,
-            details=details_section,
-            next_actions=next_actions_section,
-            full_report=full_report,
+            executive_summary=parts[1],
+            details=parts[2],
+            next_actions=parts[3],
+            full_report="\n\n".join(parts),
             format_type=OutputFormat.MARKDOWN,
         )
 
@@ -104,40 +143,38 @@ class OutputFormatter:
         self, report: GeneratedReport, report_type: str, target_name: str
     ) -> FormattedOutput:
         """テキスト形式でフォーマット"""
-        report_type_text = "週報" if report_type == "weekly" else "月報"
-        date_str = datetime.now().strftime("%Y年%m月%d日")
+        report_type_text = _REPORT_TYPE_LABELS.get(report_type, "週報")
+        date_str = _date_label(datetime.now().date())
 
         # エグゼクティブサマリ（文字数制御）
         summary = self._truncate_text(
             report.executive_summary, self._max_summary_chars
         )
-        summary_section = f"【エグゼクティブサマリ】\n{summary}"
-
-        # 詳細内容
-        details_section = f"【詳細内容】\n{report.details}"
-
         # ネクストアクション
         next_actions_list = "\n".join(
-            f"  {i}. {action}" for i, action in enumerate(report.next_actions, 1)
+            [f"  {i}. {action}" for i, action in enumerate(report.next_actions, 1)]
         )
-        next_actions_section = f"【ネクストアクション】\n{next_actions_list}"
 
-        # フルレポート
-        header_parts = [f"{'=' * 50}", f"{report_type_text}"]
+        # ヘッダー
+        header_parts = [self._TEXT_SEP, report_type_text]
         if target_name:
             header_parts.append(f"報告対象: {target_name}")
-        header_parts.extend([f"作成日: {date_str}", f"{'=' * 50}"])
-        header = "\n".join(header_parts)
+        header_parts.extend([f"作成日: {date_str}", self._TEXT_SEP])
 
-        full_report = "\n\n".join(
-            [header, summary_section, details_section, next_actions_section]
-        )
+        # 各セクションを1つのリストに組み立て、そのままjoinと
+        # 戻り値の両方に使う
+        parts = [
+            "\n".join(header_parts),
+            self._TEXT_SUMMARY_HDR + summary,
+            self._TEXT_DETAILS_HDR + report.details,
+            self._TEXT_ACTIONS_HDR + next_actions_list,
+        ]
 
         return FormattedOutput(
-            executive_summary=summary_section,
-            details=details_section,
-            next_actions=next_actions_section,
-            full_report=full_report,
+            executive_summary=parts[1],
+            details=parts[2],
+            next_actions=parts[3],
+            full_report="\n\n".join(parts),
             format_type=OutputFormat.TEXT,
         )
 
@@ -146,13 +183,9 @@ class OutputFormatter:
         if len(text) <= max_chars:
             return text
 
-        # 文末で切る（句読点を探す）
+        # 文末で切る（句点の種類を正規化してから1回のrfindで探す）
         truncated = text[:max_chars]
-        last_period = max(
-            truncated.rfind("。"),
-            truncated.rfind("．"),
-            truncated.rfind("."),
-        )
+        last_period = truncated.translate(_SENT_END_TABLE).rfind("。")
 
         if last_period > max_chars * 0.7:  # 70%以上の位置に句点があれば
             return truncated[: last_period + 1]
@@ -173,18 +206,57 @@ class OutputFormatter:
     ) -> str:
         """ネクストアクションのみを取得"""
         if output_format == OutputFormat.MARKDOWN:
-            return "\n".join(f"- {action}" for action in report.next_actions)
+            return "\n".join([f"- {action}" for action in report.next_actions])
         else:
             return "\n".join(
-                f"{i}. {action}" for i, action in enumerate(report.next_actions, 1)
+                [f"{i}. {action}" for i, action in enumerate(report.next_actions, 1)]
             )
 
 
+# フォーマッタ未指定のReportExporterが共有するデフォルトインスタンス
+# （エクスポートのたびに生成しない）
+_DEFAULT_FORMATTER = OutputFormatter()
+
+
 class ReportExporter:
     """報告書をファイルにエクスポートするクラス"""
 
+    # フォーマット結果キャッシュの上限
+    _FORMAT_CACHE_MAX = 8
+
     def __init__(self, formatter: Optional[OutputFormatter] = None):
-        self._formatter = formatter or OutputFormatter()
+        self._formatter = formatter or _DEFAULT_FORMATTER
+        # 同一報告書をファイルとクリップボードの両方へ出力するときに
+        # 二重フォーマットしないためのLRUキャッシュ。
+        # キーのid()が有効であり続けるよう、値にreport自体も保持して
+        # 参照を固定する（解放後に同じアドレスへ別の報告書が割り当て
+        # られると誤ヒットするため）
+        self._format_cache: OrderedDict[
+            tuple, tuple[GeneratedReport, FormattedOutput]
+        ] = OrderedDict()
+
+    def _get_formatted(
+        self,
+        report: GeneratedReport,
+        output_format: OutputFormat,
+        report_type: str,
+        target_name: str,
+    ) -> FormattedOutput:
+        """フォーマット結果をキャッシュ経由で取得する"""
+        key = (id(report), output_format, report_type, target_name)
+
+        cached = self._format_cache.get(key)
+        if cached is not None and cached[0] is report:
+            self._format_cache.move_to_end(key)
+            return cached[1]
+
+        formatted = self._formatter.format(
+            report, output_format, report_type, target_name
+        )
+        self._format_cache[key] = (report, formatted)
+        while len(self._format_cache) > self._FORMAT_CACHE_MAX:
+            self._format_cache.popitem(last=False)
+        return formatted
 
     def export_to_file(
         self,
@@ -207,12 +279,12 @@ class ReportExporter:
         Returns:
             出力したファイルパス
         """
-        formatted = self._formatter.format(
+        formatted = self._get_formatted(
             report, output_format, report_type, target_name
         )
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(formatted.full_report)
+        # open/write/closeの3段呼び出しを1回のwrite_textにまとめる
+        Path(file_path).write_text(formatted.full_report, encoding="utf-8")
 
         return file_path
 
@@ -235,15 +307,11 @@ class ReportExporter:
         Returns:
             コピーしたテキスト
         """
-        formatted = self._formatter.format(
+        formatted = self._get_formatted(
             report, output_format, report_type, target_name
         )
 
-        try:
-            import pyperclip
-
-            pyperclip.copy(formatted.full_report)
-        except ImportError:
-            pass  # pyperclipがない場合は何もしない
+        if _pyperclip is not None:
+            _pyperclip.copy(formatted.full_report)
 
         return formatted.full_report
@@ -1,12 +1,30 @@
 """報告対象者プロファイル管理モジュール"""
 
-import json
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+# orjsonによる高速シリアライズはオプション
+# （profiles.jsonは機械のみが読むファイルのためインデントは付けない）
+try:
+    import orjson as _json
 
-@dataclass
+    _dumps = _json.dumps
+    _loads = _json.loads
+except ImportError:
+    import json as _json
+
+    def _dumps(obj) -> bytes:
+        return _json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+    _loads = _json.loads
+
+
+@dataclass(slots=True)
 class TargetProfile:
     """報告対象者のプロファイル"""
 
@@ -46,52 +64,69 @@ class TargetProfile:
         )
 
     def get_prompt_context(self) -> str:
-        """プロンプト用のコンテキスト情報を生成"""
-        context_parts = [
-            f"報告対象者: {self.name}（{self.role}）",
-            f"関心事: {self.focus}",
-        ]
-        if self.description:
-            context_parts.append(f"補足情報: {self.description}")
-
-        return "\n".join(context_parts)
-
-
-# デフォルトプロファイルのテンプレート
-DEFAULT_PROFILES = [
-    TargetProfile(
-        name="課長",
-        role="課長",
-        focus="納期重視",
-        description="スケジュール遵守と進捗状況を重視。遅延リスクがあれば早期に報告を求める。",
-        summary_max_chars=300,
-        detail_level="medium",
-    ),
-    TargetProfile(
-        name="室長",
-        role="室長",
-        focus="方針重視",
-        description="全体方針との整合性を重視。戦略的な観点からの報告を好む。",
-        summary_max_chars=400,
-        detail_level="medium",
-    ),
-    TargetProfile(
-        name="部長",
-        role="部長",
-        focus="コスト重視",
-        description="コスト効率とROIを重視。予算への影響を明確にした報告を求める。",
-        summary_max_chars=250,
-        detail_level="low",
-    ),
-    TargetProfile(
-        name="メンバー",
-        role="メンバー",
-        focus="詳細重視",
-        description="技術的な詳細や具体的な作業内容を重視。実装レベルの情報を求める。",
-        summary_max_chars=500,
-        detail_level="high",
-    ),
-]
+        """プロンプト用のコンテキスト情報を生成（同一内容ならメモ化して返す）"""
+        return _build_prompt_context(self.name, self.role, self.focus, self.description)
+
+
+@lru_cache(maxsize=32)
+def _build_prompt_context(name: str, role: str, focus: str, description: str) -> str:
+    """プロンプト用のコンテキスト文字列を組み立てる
+
+    報告のたびに同じプロファイルで呼ばれるため、slots付きdataclassでも
+    使えるよう、フィールド値をキーにしたモジュール関数でメモ化する
+    （cached_propertyはインスタンスの__dict__を要求するため使えない）。
+    """
+    context_parts = [
+        f"報告対象者: {name}（{role}）",
+        f"関心事: {focus}",
+    ]
+    if description:
+        context_parts.append(f"補足情報: {description}")
+
+    return "\n".join(context_parts)
+
+
+@lru_cache(maxsize=1)
+def _default_profiles() -> tuple[TargetProfile, ...]:
+    """デフォルトプロファイルのテンプレートを生成する
+
+    最初に必要になったときに一度だけ構築し、以後はどのProfileManagerの
+    初期化・リセットでも同じタプルを使い回す。
+    """
+    return (
+        TargetProfile(
+            name="課長",
+            role="課長",
+            focus="納期重視",
+            description="スケジュール遵守と進捗状況を重視。遅延リスクがあれば早期に報告を求める。",
+            summary_max_chars=300,
+            detail_level="medium",
+        ),
+        TargetProfile(
+            name="室長",
+            role="室長",
+            focus="方針重視",
+            description="全体方針との整合性を重視。戦略的な観点からの報告を好む。",
+            summary_max_chars=400,
+            detail_level="medium",
+        ),
+        TargetProfile(
+            name="部長",
+            role="部長",
+            focus="コスト重視",
+            description="コスト効率とROIを重視。予算への影響を明確にした報告を求める。",
+            summary_max_chars=250,
+            detail_level="low",
+        ),
+        TargetProfile(
+            name="メンバー",
+            role="メンバー",
+            focus="詳細重視",
+            description="技術的な詳細や具体的な作業内容を重視。実装レベルの情報を求める。",
+            summary_max_chars=500,
+            detail_level="high",
+        ),
+    )
 
 
 class ProfileManager:
@@ -111,37 +146,77 @@ class ProfileManager:
 
         self._storage_dir.mkdir(parents=True, exist_ok=True)
         self._profiles_file = self._storage_dir / self.PROFILES_FILE
-        self._profiles: dict[str, TargetProfile] = {}
 
-        self._load_profiles()
+        # 初回アクセス時に読み込む（Noneは未読み込みを表す）
+        self._profiles: Optional[dict[str, TargetProfile]] = None
+
+        # batch()中の保存をまとめるためのフラグ
+        self._batching = False
+        self._dirty = False
+
+    def _ensure_loaded(self) -> None:
+        """未読み込みならプロファイルを読み込む
+
+        構築時ではなく最初のデータアクセス時までファイル読み込みと
+        JSONデコードを遅延する。
+        """
+        if self._profiles is None:
+            self._load_profiles()
+
+    @contextmanager
+    def batch(self):
+        """複数の更新を1回のディスク書き込みにまとめる
+
+        withブロック中のadd_profile/delete_profileなどは保存を
+        遅延し、ブロックを抜けるときに変更があれば一度だけ書き込む。
+        """
+        if self._batching:
+            # ネストした場合は外側のbatchに任せる
+            yield
+            return
+
+        self._batching = True
+        try:
+            yield
+        finally:
+            self._batching = False
+            if self._dirty:
+                self._save_profiles()
 
     def _load_profiles(self) -> None:
-        """プロファイルを読み込む"""
-        if self._profiles_file.exists():
-            try:
-                with open(self._profiles_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                self._profiles = {
-                    name: TargetProfile.from_dict(profile_data)
-                    for name, profile_data in data.items()
-                }
-            except (json.JSONDecodeError, Exception):
-                self._profiles = {}
-        else:
+        """プロファイルを読み込む
+
+        exists()での事前チェック（stat + openの2回のシステムコール）は
+        せず、openに失敗したらデフォルトを初期化する。
+        """
+        try:
+            data = _loads(self._profiles_file.read_bytes())
+            self._profiles = {
+                name: TargetProfile.from_dict(profile_data)
+                for name, profile_data in data.items()
+            }
+        except FileNotFoundError:
             # デフォルトプロファイルを設定
             self._initialize_defaults()
+        except Exception:
+            self._profiles = {}
 
     def _initialize_defaults(self) -> None:
         """デフォルトプロファイルを初期化"""
-        for profile in DEFAULT_PROFILES:
-            self._profiles[profile.name] = profile
-        self._save_profiles()
+        self._profiles = {}
+        with self.batch():
+            for profile in _default_profiles():
+                self.add_profile(profile)
 
     def _save_profiles(self) -> None:
-        """プロファイルを保存"""
+        """プロファイルを保存（batch中は書き込みを遅延する）"""
+        if self._batching:
+            self._dirty = True
+            return
+
         data = {name: profile.to_dict() for name, profile in self._profiles.items()}
-        with open(self._profiles_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        self._profiles_file.write_bytes(_dumps(data))
+        self._dirty = False
 
     def add_profile(self, profile: TargetProfile) -> None:
         """
@@ -150,6 +225,7 @@ class ProfileManager:
         Args:
             profile: 追加するプロファイル
         """
+        self._ensure_loaded()
         self._profiles[profile.name] = profile
         self._save_profiles()
 
@@ -163,6 +239,7 @@ class ProfileManager:
         Returns:
             プロファイル、見つからない場合はNone
         """
+        self._ensure_loaded()
         return self._profiles.get(name)
 
     def delete_profile(self, name: str) -> bool:
@@ -175,6 +252,7 @@ class ProfileManager:
         Returns:
             削除成功の場合True
         """
+        self._ensure_loaded()
         if name in self._profiles:
             del self._profiles[name]
             self._save_profiles()
@@ -188,6 +266,7 @@ class ProfileManager:
         Returns:
             プロファイルのリスト
         """
+        self._ensure_loaded()
         return list(self._profiles.values())
 
     def get_profile_names(self) -> list[str]:
@@ -197,9 +276,10 @@ class ProfileManager:
         Returns:
             プロファイル名のリスト
         """
+        self._ensure_loaded()
         return list(self._profiles.keys())
 
     def reset_to_defaults(self) -> None:
         """デフォルトプロファイルにリセットする"""
-        self._profiles = {}
+        # 既存の読み込み状態によらず丸ごと置き換えるため_ensure_loadedは不要
         self._initialize_defaults()
@@ -1,10 +1,93 @@
 """プロンプト設計・生成モジュール"""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 from .profile_manager import TargetProfile
 
+# 詳細度レベル → プロンプト内の説明文
+_DETAIL_LEVEL_DESC = {
+    "low": "簡潔に記載",
+    "medium": "適度な詳細度で記載",
+    "high": "詳細に記載",
+}
+
+
+@lru_cache(maxsize=64)
+def _render_user_prompt(
+    report_type: str,
+    target_info: str,
+    summary_max_chars: int,
+    detail_level: str,
+    preferred_format: str,
+    todo_text: str,
+    previous_report: Optional[str],
+    additional_notes: Optional[str],
+) -> str:
+    """ユーザープロンプト本文を組み立てる
+
+    同じプロファイル・同じToDoでの再生成（リトライなど）では
+    組み立てをまるごとスキップできるよう、selfを含まない
+    モジュール関数としてlru_cacheに載せる。
+    """
+    report_type_text = "週報" if report_type == "weekly" else "月報"
+
+    # 詳細度の説明
+    detail_level_desc = _DETAIL_LEVEL_DESC.get(detail_level, "適度な詳細度で記載")
+
+    # 出力形式
+    output_format = (
+        "Markdown形式" if preferred_format == "markdown" else "テキスト形式"
+    )
+
+    # セクションをリストに組み立てて最後に1回だけ連結する
+    # （空のセクションは最初から追加しない）
+    parts = [
+        f"""## 報告書作成依頼
+
+### 報告タイプ
+{report_type_text}
+
+### 報告対象者情報
+{target_info}
+
+### 出力設定
+- エグゼクティブサマリ: {summary_max_chars}文字以内
+- 詳細度レベル: {detail_level}
+- 出力形式: {output_format}
+
+### ToDoリスト（今回の作業内容）
+{todo_text}"""
+    ]
+
+    # 前回報告セクション
+    if previous_report:
+        parts.append(f"""### 前回の報告内容（差分比較用）
+{previous_report}
+
+※前回からの進捗差分を考慮して報告書を作成してください。""")
+
+    # 追加メモセクション
+    if additional_notes:
+        parts.append(f"""### 追加メモ
+{additional_notes}""")
+
+    parts.append(f"""## 出力形式
+
+以下の形式で報告書を作成してください：
+
+### エグゼクティブサマリ
+（{summary_max_chars}文字以内で、報告対象者の関心事に焦点を当てて記載）
+
+### 詳細内容
+（進捗状況、成果、課題などを{detail_level_desc}）
+
+### ネクストアクション
+（報告対象者の関心事を反映した、具体的なアクションを箇条書きで記載）""")
+
+    return "\n\n".join(parts)
+
 
 @dataclass
 class ReportContext:
@@ -48,44 +131,7 @@ class PromptBuilder:
 - **コスト重視**: リソース効率、ROI、予算影響を強調
 - **詳細重視**: 技術的詳細、具体的な実装内容を詳しく記載"""
 
-    # ユーザープロンプトのテンプレート
-    USER_PROMPT_TEMPLATE = """## 報告書作成依頼
-
-### 報告タイプ
-{report_type}
-
-### 報告対象者情報
-{target_info}
-
-### 出力設定
-- エグゼクティブサマリ: {summary_max_chars}文字以内
-- 詳細度レベル: {detail_level}
-- 出力形式: {output_format}
-
-### ToDoリスト（今回の作業内容）
-{todo_text}
-
-{previous_section}
-{additional_section}
-
-## 出力形式
-
-以下の形式で報告書を作成してください：
-
-### エグゼクティブサマリ
-（{summary_max_chars}文字以内で、報告対象者の関心事に焦点を当てて記載）
-
-### 詳細内容
-（進捗状況、成果、課題などを{detail_level_desc}）
-
-### ネクストアクション
-（報告対象者の関心事を反映した、具体的なアクションを箇条書きで記載）"""
-
-    DETAIL_LEVEL_DESC = {
-        "low": "簡潔に記載",
-        "medium": "適度な詳細度で記載",
-        "high": "詳細に記載",
-    }
+    DETAIL_LEVEL_DESC = _DETAIL_LEVEL_DESC
 
     def build_system_prompt(self) -> str:
         """システムプロンプトを生成"""
@@ -101,44 +147,19 @@ class PromptBuilder:
         Returns:
             生成されたユーザープロンプト
         """
-        report_type_text = "週報" if context.report_type == "weekly" else "月報"
-
-        # 前回報告セクション
-        previous_section = ""
-        if context.previous_report:
-            previous_section = f"""### 前回の報告内容（差分比較用）
-{context.previous_report}
-
-※前回からの進捗差分を考慮して報告書を作成してください。"""
-
-        # 追加メモセクション
-        additional_section = ""
-        if context.additional_notes:
-            additional_section = f"""### 追加メモ
-{context.additional_notes}"""
-
-        # 詳細度の説明
-        detail_level_desc = self.DETAIL_LEVEL_DESC.get(
-            context.target_profile.detail_level, "適度な詳細度で記載"
-        )
-
-        # 出力形式
-        output_format = (
-            "Markdown形式"
-            if context.target_profile.preferred_format == "markdown"
-            else "テキスト形式"
-        )
-
-        return self.USER_PROMPT_TEMPLATE.format(
-            report_type=report_type_text,
-            target_info=context.target_profile.get_prompt_context(),
-            summary_max_chars=context.target_profile.summary_max_chars,
-            detail_level=context.target_profile.detail_level,
-            detail_level_desc=detail_level_desc,
-            output_format=output_format,
-            todo_text=context.todo_text,
-            previous_section=previous_section,
-            additional_section=additional_section,
+        profile = context.target_profile
+        # プロファイルから文字列・数値だけを取り出してキャッシュ関数に渡す
+        # （メソッドに直接@lru_cacheを付けるとselfのハッシュ計算が入るうえ、
+        # インスタンスがキャッシュに残り続けるため、モジュール関数に委譲する）
+        return _render_user_prompt(
+            context.report_type,
+            profile.get_prompt_context(),
+            profile.summary_max_chars,
+            profile.detail_level,
+            profile.preferred_format,
+            context.todo_text,
+            context.previous_report,
+            context.additional_notes,
         )
 
     def build_diff_analysis_prompt(
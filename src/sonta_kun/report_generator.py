@@ -1,6 +1,5 @@
 """報告書生成モジュール"""
 
-import re
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
@@ -13,6 +12,130 @@ from .profile_manager import ProfileManager, TargetProfile
 from .prompt_builder import PromptBuilder, ReportContext
 from .report_storage import ReportData, ReportStorage
 
+# セクション抽出に使うヘッダー候補（大文字小文字を無視して照合するため
+# casefold済み。長い候補を先に並べ、前方一致の短い候補に食われないようにする）
+_SECTION_HEADERS = {
+    "summary": ("エグゼクティブサマリ", "executive summary", "サマリ"),
+    "details": ("詳細内容", "詳細", "details", "detail"),
+    "next_actions": ("ネクストアクション", "next action", "次のアクション"),
+}
+
+
+def _casefold_aligned(text: str) -> str:
+    """textと同じ長さを保ったままcasefoldする
+
+    casefoldは長さを変える文字がある（ß→ssなど）。lowered上で
+    見つけたインデックスをtextにそのまま適用するため、長さが変わる
+    場合は該当文字だけ原文のまま残して位置を揃える（ヘッダー候補は
+    そのような文字を含まないので照合には影響しない）。
+    """
+    lowered = text.casefold()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(cf if len(cf := c.casefold()) == 1 else c for c in text)
+
+
+def _find_section(text: str, lowered: str, headers: tuple[str, ...]) -> str:
+    """str.findでマークダウンのセクション本文を取り出す
+
+    ヘッダーは固定文字列でセクション境界は改行+#なので、正規表現
+    エンジンを通さずインデックス演算だけで探索できる。loweredは
+    textを_casefold_alignedで畳んだもので、呼び出し側が1回だけ
+    作って使い回す。
+
+    Args:
+        text: レスポンス本文
+        lowered: textを_casefold_alignedで畳んだ文字列（textと同じ長さ）
+        headers: casefold済みのヘッダー候補
+
+    Returns:
+        最初に見つかったセクションの本文（見つからなければ空文字列）
+    """
+    best = -1  # 採用したヘッダーの出現位置
+    content = ""
+
+    for header in headers:
+        start = 0
+        while True:
+            i = lowered.find(header, start)
+            if i == -1 or (best != -1 and i >= best):
+                break
+
+            # ヘッダー直前が「#が1個以上 + 空白」の形かを確認する
+            j = i
+            while j > 0 and text[j - 1] in " \t":
+                j -= 1
+            has_hashes = j > 0 and text[j - 1] == "#"
+
+            if has_hashes:
+                # ヘッダー行の残りを読み飛ばし、次の「\n#」までを本文とする
+                nl = text.find("\n", i + len(header))
+                if nl != -1:
+                    end = text.find("\n#", nl)
+                    if end == -1:
+                        end = len(text)
+                    best = i
+                    content = text[nl + 1 : end].strip()
+                    break
+
+            start = i + 1
+
+    return content
+
+def _bullet_content(line: str) -> Optional[str]:
+    """行が箇条書きの開始なら、マーカーを除いた内容を返す
+
+    数字付きリスト（1. xxx / 1) xxx）と箇条書き（- * •）に対応する。
+    箇条書きの開始でなければNoneを返す。
+    """
+    stripped = line.lstrip()
+    # 空行は箇条書きではない（空文字列のin判定は常にTrueになるため
+    # スライスではなく先頭1文字で判定する）
+    if stripped and stripped[0] in "-*•":
+        return stripped[1:].lstrip()
+
+    # 数字列 + "." または ")" を先頭から走査する
+    i = 0
+    while i < len(stripped) and stripped[i].isdigit():
+        i += 1
+    if i and i < len(stripped) and stripped[i] in ".)":
+        return stripped[i + 1 :].lstrip()
+
+    return None
+
+
+def _parse_bullet_list(text: str) -> list[str]:
+    """箇条書きをリストに変換
+
+    正規表現のバックトラックを使わず、行単位の線形走査で
+    箇条書きの開始行と継続行を振り分ける。
+    """
+    if not text:
+        return []
+
+    items: list[str] = []
+    current: list[str] = []
+
+    def flush() -> None:
+        item = "\n".join(current).strip()
+        if item:
+            items.append(item)
+
+    for line in text.split("\n"):
+        content = _bullet_content(line)
+        if content is not None:
+            if current:
+                flush()
+            current = [content]
+        elif current:
+            # 箇条書きの途中の行は現在のアイテムへの継続とみなす
+            current.append(line)
+
+    if current:
+        flush()
+
+    return items
+
 
 @dataclass
 class GeneratedReport:
@@ -82,8 +205,10 @@ class ReportGenerator:
             diff_result = self._diff_analyzer.analyze(todo_list, previous_todos)
             diff_context = f"\n\n### 前回からの差分\n{diff_result.to_text()}"
 
-        # ToDoリストをテキスト化
-        todo_text = todo_list.to_text()
+        # ToDoリストをテキスト化（保存時のtodo_summaryにも使い回すため、
+        # 差分を連結する前のテキストを保持しておく）
+        todo_text_base = todo_list.to_text()
+        todo_text = todo_text_base
         if diff_context:
             todo_text += diff_context
 
@@ -115,7 +240,7 @@ class ReportGenerator:
                 report_type=report_type,
                 target_person=target_profile.name,
                 created_at=datetime.now().isoformat(),
-                todo_summary=todo_list.to_text()[:500],
+                todo_summary=todo_text_base[:500],
                 executive_summary=generated.executive_summary,
                 details=generated.details,
                 next_actions=generated.next_actions,
@@ -166,19 +291,18 @@ class ReportGenerator:
         self, response: str, diff_result: Optional[DiffResult]
     ) -> GeneratedReport:
         """AIレスポンスを解析"""
-        # セクションを抽出
-        executive_summary = self._extract_section(
-            response, ["エグゼクティブサマリ", "Executive Summary", "サマリ"]
-        )
-        details = self._extract_section(
-            response, ["詳細内容", "詳細", "Details", "Detail"]
+        # セクションを抽出（casefoldは全セクション共通で1回だけ）
+        lowered = _casefold_aligned(response)
+        executive_summary = _find_section(
+            response, lowered, _SECTION_HEADERS["summary"]
         )
-        next_actions_text = self._extract_section(
-            response, ["ネクストアクション", "Next Action", "次のアクション"]
+        details = _find_section(response, lowered, _SECTION_HEADERS["details"])
+        next_actions_text = _find_section(
+            response, lowered, _SECTION_HEADERS["next_actions"]
         )
 
         # ネクストアクションをリスト化
-        next_actions = self._parse_bullet_list(next_actions_text)
+        next_actions = _parse_bullet_list(next_actions_text)
 
         return GeneratedReport(
             executive_summary=executive_summary,
@@ -188,35 +312,6 @@ class ReportGenerator:
             diff_result=diff_result,
         )
 
-    def _extract_section(self, text: str, headers: list[str]) -> str:
-        """セクションを抽出"""
-        for header in headers:
-            # マークダウンヘッダーパターン
-            pattern = rf"#{{1,3}}\s*{re.escape(header)}[^\n]*\n(.*?)(?=\n#|\Z)"
-            match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-
-        return ""
-
-    def _parse_bullet_list(self, text: str) -> list[str]:
-        """箇条書きをリストに変換"""
-        if not text:
-            return []
-
-        items = []
-        # 数字付きリスト: 1. xxx or 1) xxx
-        # 箇条書き: - xxx or * xxx or • xxx
-        pattern = r"(?:^|\n)\s*(?:[\d]+[.)]\s*|[-*•]\s*)(.+?)(?=\n\s*(?:[\d]+[.)]\s*|[-*•]\s*)|\Z)"
-        matches = re.findall(pattern, text, re.DOTALL)
-
-        for match in matches:
-            item = match.strip()
-            if item:
-                items.append(item)
-
-        return items
-
     def get_available_profiles(self) -> list[str]:
         """利用可能なプロファイル名を取得"""
         return self._profile_manager.get_profile_names()
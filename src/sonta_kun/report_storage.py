@@ -1,13 +1,40 @@
 """報告データの保存・読み込みモジュール"""
 
-import json
+import heapq
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+# orjsonによる高速シリアライズはオプション
+try:
+    import orjson as _json
 
-@dataclass
+    def _dumps(obj) -> bytes:
+        return _json.dumps(obj, option=_json.OPT_INDENT_2)
+
+    _dumps_line = _json.dumps
+    _loads = _json.loads
+except ImportError:
+    import dataclasses as _dataclasses
+    import json as _json
+
+    def _dumps(obj) -> bytes:
+        return _json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+    def _dumps_line(obj) -> bytes:
+        # orjsonと違いdataclassを直接は扱えないため辞書化してから書く
+        if _dataclasses.is_dataclass(obj):
+            obj = _dataclasses.asdict(obj)
+        return _json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+    _loads = _json.loads
+
+
+@dataclass(slots=True)
 class ReportData:
     """報告データ"""
 
@@ -72,7 +99,8 @@ class ReportStorage:
     """報告データの保存・読み込みを管理するクラス"""
 
     DEFAULT_STORAGE_DIR = ".sonta_kun"
-    REPORTS_FILE = "reports.json"
+    REPORTS_FILE = "reports.jsonl"
+    LEGACY_REPORTS_FILE = "reports.json"
 
     def __init__(self, storage_dir: Optional[Path] = None):
         """
@@ -87,16 +115,45 @@ class ReportStorage:
         self._storage_dir.mkdir(parents=True, exist_ok=True)
         self._reports_file = self._storage_dir / self.REPORTS_FILE
 
+        # パース済みレコードのキャッシュ（st_mtime_nsで失効を判定する。
+        # メソッドへの@lru_cacheはselfのハッシュ計算が入るため使わない）
+        self._cache: Optional[list[dict]] = None
+        self._cache_mtime: int = -1
+
+        # フィルタ条件 → キャッシュ内インデックスの二次索引
+        # （キャッシュ更新時に併せて再構築する）
+        self._by_type: dict[str, list[int]] = {}
+        self._by_target: dict[str, list[int]] = {}
+
+        self._migrate_legacy_reports()
+
+    def _migrate_legacy_reports(self) -> None:
+        """旧形式のreports.json（配列）をJSON Linesへ一度だけ移行する"""
+        legacy_file = self._storage_dir / self.LEGACY_REPORTS_FILE
+        if self._reports_file.exists() or not legacy_file.exists():
+            return
+
+        try:
+            reports = _loads(legacy_file.read_bytes())
+        except Exception:
+            return
+        if isinstance(reports, list):
+            self._save_all_reports(reports)
+
     def save_report(self, report: ReportData) -> None:
         """
         報告データを保存する
 
+        全件の読み直し・書き直しはせず、JSON Linesログへ
+        1レコードだけ追記する。orjsonはslots付きdataclassを
+        そのままエンコードできるため、中間の辞書も作らない。
+
         Args:
             report: 保存する報告データ
         """
-        reports = self._load_all_reports()
-        reports.append(report.to_dict())
-        self._save_all_reports(reports)
+        with open(self._reports_file, "ab") as f:
+            f.write(_dumps_line(report) + b"\n")
+        self._cache = None
 
     def get_latest_report(
         self,
@@ -113,23 +170,16 @@ class ReportStorage:
         Returns:
             最新の報告データ、見つからない場合はNone
         """
-        reports = self._load_all_reports()
-
-        # フィルタリング
-        filtered = reports
-        if report_type:
-            filtered = [r for r in filtered if r.get("report_type") == report_type]
-        if target_person:
-            filtered = [r for r in filtered if r.get("target_person") == target_person]
+        # ログは時系列順に追記されるため、末尾から逆順に走査して
+        # 最初に条件へ一致したレコードが最新（全件ロード・ソート不要）
+        for record in self._iter_reports_reverse():
+            if report_type and record.get("report_type") != report_type:
+                continue
+            if target_person and record.get("target_person") != target_person:
+                continue
+            return ReportData.from_dict(record)
 
-        if not filtered:
-            return None
-
-        # 日時でソートして最新を取得
-        sorted_reports = sorted(
-            filtered, key=lambda r: r.get("created_at", ""), reverse=True
-        )
-        return ReportData.from_dict(sorted_reports[0])
+        return None
 
     def get_reports(
         self,
@@ -150,19 +200,24 @@ class ReportStorage:
         """
         reports = self._load_all_reports()
 
-        # フィルタリング
-        filtered = reports
-        if report_type:
-            filtered = [r for r in filtered if r.get("report_type") == report_type]
-        if target_person:
-            filtered = [r for r in filtered if r.get("target_person") == target_person]
+        # 二次索引の辞書引きでフィルタし、全件の線形走査を避ける
+        if report_type and target_person:
+            indices = sorted(
+                set(self._by_type.get(report_type, ()))
+                & set(self._by_target.get(target_person, ()))
+            )
+            filtered = [reports[i] for i in indices]
+        elif report_type:
+            filtered = [reports[i] for i in self._by_type.get(report_type, ())]
+        elif target_person:
+            filtered = [reports[i] for i in self._by_target.get(target_person, ())]
+        else:
+            filtered = reports
 
-        # 日時でソートして制限
-        sorted_reports = sorted(
-            filtered, key=lambda r: r.get("created_at", ""), reverse=True
-        )
+        # 全体をソートせず、上位limit件だけをO(n log k)で取り出す
+        top = heapq.nlargest(limit, filtered, key=lambda r: r.get("created_at", ""))
 
-        return [ReportData.from_dict(r) for r in sorted_reports[:limit]]
+        return [ReportData.from_dict(r) for r in top]
 
     def load_from_file(self, file_path: str | Path) -> ReportData:
         """
@@ -178,14 +233,13 @@ class ReportStorage:
             StorageError: 読み込みに失敗した場合
         """
         path = Path(file_path)
-        if not path.exists():
-            raise StorageError(f"ファイルが見つかりません: {path}")
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _loads(path.read_bytes())
             return ReportData.from_dict(data)
-        except json.JSONDecodeError as e:
+        except FileNotFoundError:
+            raise StorageError(f"ファイルが見つかりません: {path}") from None
+        except ValueError as e:
             raise StorageError(f"JSONの解析に失敗しました: {e}") from e
         except Exception as e:
             raise StorageError(f"ファイルの読み込みに失敗しました: {e}") from e
@@ -202,38 +256,118 @@ class ReportStorage:
         """
         return text.strip()
 
-    def export_report(self, report: ReportData, file_path: str | Path) -> None:
+    def export_report(
+        self, report: ReportData, file_path: str | Path, pretty: bool = True
+    ) -> None:
         """
         報告データをファイルにエクスポートする
 
         Args:
             report: エクスポートする報告データ
             file_path: 出力先ファイルパス
+            pretty: JSON出力をインデント付きで整形するかどうか
         """
         path = Path(file_path)
 
         if path.suffix.lower() == ".json":
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(report.to_dict(), f, ensure_ascii=False, indent=2)
+            data = report.to_dict()
+            path.write_bytes(_dumps(data) if pretty else _dumps_line(data))
         else:
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(report.to_text())
+            path.write_text(report.to_text(), encoding="utf-8")
+
+    # 逆順読みで一度に読み込むブロックサイズ
+    _TAIL_BLOCK_SIZE = 64 * 1024
+
+    def _iter_reports_reverse(self):
+        """JSON Linesログを末尾から1レコードずつ逆順に読む
+
+        EOFからブロック単位で後方へ読み進めるため、最新レコードの
+        取得は通常ディスクブロック1回分の読み込みで済む。
+        """
+        try:
+            f = open(self._reports_file, "rb")
+        except FileNotFoundError:
+            return
+
+        with f:
+            pos = f.seek(0, os.SEEK_END)
+            buffer = b""
+            while pos > 0:
+                read_size = min(self._TAIL_BLOCK_SIZE, pos)
+                pos -= read_size
+                f.seek(pos)
+                buffer = f.read(read_size) + buffer
+                lines = buffer.split(b"\n")
+                # 先頭行はブロック境界で欠けている可能性があるため持ち越す
+                buffer = lines[0]
+                for line in reversed(lines[1:]):
+                    if line:
+                        try:
+                            yield _loads(line)
+                        except ValueError:
+                            continue
+
+        if buffer:
+            try:
+                yield _loads(buffer)
+            except ValueError:
+                pass
 
     def _load_all_reports(self) -> list[dict]:
-        """すべての報告データを読み込む"""
-        if not self._reports_file.exists():
-            return []
+        """すべての報告データを読み込む（mtimeが同じ間はキャッシュを返す）"""
+        # exists()の事前チェックはせず、statの失敗でファイルなしと判定する
+        # （mtime取得に必要なstatが存在チェックを兼ねる）
+        try:
+            mtime = self._reports_file.stat().st_mtime_ns
+        except OSError:
+            # ファイルが消えても索引を空に揃える。古い索引のまま空リストを
+            # 引くとget_reportsがIndexErrorになる
+            return self._reset_cache()
+
+        if self._cache is not None and mtime == self._cache_mtime:
+            return self._cache
 
         try:
-            with open(self._reports_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, Exception):
-            return []
+            reports = [
+                _loads(line)
+                for line in self._reports_file.read_bytes().splitlines()
+                if line
+            ]
+        except OSError:
+            return self._reset_cache()
+        except ValueError:
+            reports = []
+
+        self._cache = reports
+        self._cache_mtime = mtime
+        self._rebuild_index(reports)
+        return reports
+
+    def _reset_cache(self) -> list[dict]:
+        """キャッシュと二次索引を空の状態に揃えて空リストを返す"""
+        self._cache = None
+        self._cache_mtime = -1
+        self._rebuild_index([])
+        return []
+
+    def _rebuild_index(self, reports: list[dict]) -> None:
+        """フィルタ条件ごとの二次索引を再構築する"""
+        by_type: dict[str, list[int]] = {}
+        by_target: dict[str, list[int]] = {}
+        for i, r in enumerate(reports):
+            by_type.setdefault(r.get("report_type", ""), []).append(i)
+            by_target.setdefault(r.get("target_person", ""), []).append(i)
+        self._by_type = by_type
+        self._by_target = by_target
 
     def _save_all_reports(self, reports: list[dict]) -> None:
-        """すべての報告データを保存する"""
-        with open(self._reports_file, "w", encoding="utf-8") as f:
-            json.dump(reports, f, ensure_ascii=False, indent=2)
+        """すべての報告データをJSON Linesとして書き直す"""
+        self._reports_file.write_bytes(
+            b"".join(_dumps_line(r) + b"\n" for r in reports)
+        )
+        self._cache = reports
+        self._cache_mtime = self._reports_file.stat().st_mtime_ns
+        self._rebuild_index(reports)
 
 
 class StorageError(Exception):
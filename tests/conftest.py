@@ -0,0 +1,9 @@
+"""テスト共通のフィクスチャ"""
+
+import pytest
+
+
+@pytest.fixture
+def temp_storage_dir(tmp_path):
+    """一時ストレージディレクトリ"""
+    return tmp_path
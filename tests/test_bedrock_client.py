@@ -5,6 +5,7 @@ from unittest import mock
 
 import pytest
 
+from sonta_kun import bedrock_client
 from sonta_kun.bedrock_client import BedrockClient, BedrockError
 from sonta_kun.config import BedrockConfig
 
@@ -12,8 +13,10 @@ from sonta_kun.config import BedrockConfig
 @pytest.fixture
 def mock_boto3_client():
     """boto3クライアントのモック"""
-    with mock.patch("sonta_kun.bedrock_client.boto3.client") as mock_client:
+    bedrock_client._CLIENTS.clear()
+    with mock.patch.object(bedrock_client._SESSION, "client") as mock_client:
         yield mock_client
+    bedrock_client._CLIENTS.clear()
 
 
 def test_bedrock_client_init(mock_boto3_client):
@@ -22,11 +25,21 @@ def test_bedrock_client_init(mock_boto3_client):
     client = BedrockClient(config)
 
     mock_boto3_client.assert_called_once_with(
-        "bedrock-runtime", region_name="ap-northeast-1"
+        "bedrock-runtime",
+        region_name="ap-northeast-1",
+        config=bedrock_client._CLIENT_CONFIG,
     )
     assert client.config == config
 
 
+def test_bedrock_client_reuses_cached_client(mock_boto3_client):
+    """同一リージョンのクライアントが再利用されるテスト"""
+    BedrockClient(BedrockConfig())
+    BedrockClient(BedrockConfig())
+
+    assert mock_boto3_client.call_count == 1
+
+
 def test_bedrock_client_generate_success(mock_boto3_client):
     """テキスト生成成功のテスト"""
     mock_response = {
@@ -46,6 +59,95 @@ def test_bedrock_client_generate_success(mock_boto3_client):
     assert result == "こんにちは！"
 
 
+def test_bedrock_client_generate_cached_when_deterministic(mock_boto3_client):
+    """temperature=0の場合にレスポンスがキャッシュされるテスト"""
+    bedrock_client._RESPONSE_CACHE.clear()
+    mock_response = {
+        "body": mock.Mock(
+            read=mock.Mock(
+                return_value=json.dumps(
+                    {"content": [{"text": "キャッシュ対象"}]}
+                ).encode()
+            )
+        )
+    }
+    mock_boto3_client.return_value.invoke_model.return_value = mock_response
+
+    client = BedrockClient(BedrockConfig(temperature=0))
+    assert client.generate("テスト") == "キャッシュ対象"
+    assert client.generate("テスト") == "キャッシュ対象"
+
+    assert mock_boto3_client.return_value.invoke_model.call_count == 1
+    bedrock_client._RESPONSE_CACHE.clear()
+
+
+def test_bedrock_client_generate_with_cacheable_prefix(mock_boto3_client):
+    """cache_controlブロック付きリクエスト構築のテスト"""
+    mock_response = {
+        "body": mock.Mock(
+            read=mock.Mock(
+                return_value=json.dumps(
+                    {"content": [{"text": "応答"}]}
+                ).encode()
+            )
+        )
+    }
+    mock_boto3_client.return_value.invoke_model.return_value = mock_response
+
+    client = BedrockClient()
+    client.generate("今週分の質問", cacheable_prefix="静的なToDoコンテキスト")
+
+    call_args = mock_boto3_client.return_value.invoke_model.call_args
+    body = json.loads(call_args.kwargs["body"])
+    content = body["messages"][0]["content"]
+    assert content[0]["text"] == "静的なToDoコンテキスト"
+    assert content[0]["cache_control"] == {"type": "ephemeral"}
+    assert content[1]["text"] == "今週分の質問"
+
+
+def test_bedrock_client_generate_stream(mock_boto3_client):
+    """ストリーミング生成のテスト"""
+
+    def _event(payload: dict) -> dict:
+        return {"chunk": {"bytes": json.dumps(payload).encode()}}
+
+    mock_boto3_client.return_value.invoke_model_with_response_stream.return_value = {
+        "body": [
+            _event({"type": "content_block_start"}),
+            _event({"type": "content_block_delta", "delta": {"text": "こんに"}}),
+            _event({"type": "content_block_delta", "delta": {"text": "ちは"}}),
+            _event({"type": "message_stop"}),
+        ]
+    }
+
+    client = BedrockClient()
+    chunks = list(client.generate_stream("テスト"))
+
+    assert chunks == ["こんに", "ちは"]
+
+
+def test_bedrock_client_generate_many(mock_boto3_client):
+    """複数プロンプトの並列生成テスト"""
+    mock_response = {
+        "body": mock.Mock(
+            read=mock.Mock(
+                return_value=json.dumps(
+                    {"content": [{"text": "応答"}]}
+                ).encode()
+            )
+        )
+    }
+    mock_boto3_client.return_value.invoke_model.return_value = mock_response
+
+    client = BedrockClient()
+    results = client.generate_many(["プロンプト1", "プロンプト2", "プロンプト3"])
+
+    assert results == ["応答", "応答", "応答"]
+    assert mock_boto3_client.return_value.invoke_model.call_count == 3
+
+    assert client.generate_many([]) == []
+
+
 def test_bedrock_client_generate_with_system_prompt(mock_boto3_client):
     """システムプロンプト付きテキスト生成のテスト"""
     mock_response = {
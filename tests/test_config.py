@@ -24,12 +24,21 @@ def test_bedrock_config_from_env():
         "BEDROCK_TEMPERATURE": "0.5",
     }
 
+    BedrockConfig.from_env.cache_clear()
     with mock.patch.dict(os.environ, env_vars, clear=False):
         config = BedrockConfig.from_env()
         assert config.region_name == "us-west-2"
         assert config.model_id == "anthropic.claude-3-opus-20240229-v1:0"
         assert config.max_tokens == 8192
         assert config.temperature == 0.5
+    BedrockConfig.from_env.cache_clear()
+
+
+def test_bedrock_config_from_env_cached():
+    """from_envの結果がキャッシュされるテスト"""
+    BedrockConfig.from_env.cache_clear()
+    assert BedrockConfig.from_env() is BedrockConfig.from_env()
+    BedrockConfig.from_env.cache_clear()
 
 
 def test_app_config_load():
@@ -6,6 +6,21 @@ from sonta_kun.diff_analyzer import DiffAnalyzer, DiffResult, TaskChange
 from sonta_kun.excel_reader import TodoItem, TodoList
 
 
+@pytest.fixture(scope="module")
+def analyzer():
+    """モジュール内で共有するDiffAnalyzer（分析間で状態を持たない）"""
+    return DiffAnalyzer()
+
+
+# 複数のテストで同じ形のTodoItemを使うため、モジュールレベルで共有する
+# （DiffAnalyzerは入力を変更しないので値として使い回せる）
+TASK_A_IN_PROGRESS = TodoItem(task="タスクA", status="進行中")
+TASK_A_DONE = TodoItem(task="タスクA", status="完了")
+TASK_B_NOT_STARTED = TodoItem(task="タスクB", status="未着手")
+TASK_B_IN_PROGRESS = TodoItem(task="タスクB", status="進行中")
+TEST_IN_PROGRESS = TodoItem(task="テスト", status="進行中")
+
+
 def test_task_change_dataclass():
     """TaskChangeのテスト"""
     change = TaskChange(
@@ -45,9 +60,8 @@ def test_diff_result_get_summary():
     assert "新規: 1件" in summary
 
 
-def test_diff_analyzer_no_previous():
+def test_diff_analyzer_no_previous(analyzer):
     """前回データなしの場合のテスト"""
-    analyzer = DiffAnalyzer()
     current = TodoList(
         items=[
             TodoItem(task="タスク1", status="進行中"),
@@ -61,22 +75,10 @@ def test_diff_analyzer_no_previous():
     assert len(result.completed_tasks) == 0
 
 
-def test_diff_analyzer_completed_task():
+def test_diff_analyzer_completed_task(analyzer):
     """タスク完了検出テスト"""
-    analyzer = DiffAnalyzer()
-
-    previous = TodoList(
-        items=[
-            TodoItem(task="タスクA", status="進行中"),
-            TodoItem(task="タスクB", status="未着手"),
-        ]
-    )
-    current = TodoList(
-        items=[
-            TodoItem(task="タスクA", status="完了"),
-            TodoItem(task="タスクB", status="進行中"),
-        ]
-    )
+    previous = TodoList(items=[TASK_A_IN_PROGRESS, TASK_B_NOT_STARTED])
+    current = TodoList(items=[TASK_A_DONE, TASK_B_IN_PROGRESS])
 
     result = analyzer.analyze(current, previous)
 
@@ -86,10 +88,8 @@ def test_diff_analyzer_completed_task():
     assert result.modified_tasks[0].task_name == "タスクB"
 
 
-def test_diff_analyzer_new_task():
+def test_diff_analyzer_new_task(analyzer):
     """新規タスク検出テスト"""
-    analyzer = DiffAnalyzer()
-
     previous = TodoList(items=[TodoItem(task="既存タスク", status="進行中")])
     current = TodoList(
         items=[
@@ -104,17 +104,10 @@ def test_diff_analyzer_new_task():
     assert result.new_tasks[0].task_name == "新規タスク"
 
 
-def test_diff_analyzer_removed_task():
+def test_diff_analyzer_removed_task(analyzer):
     """削除タスク検出テスト"""
-    analyzer = DiffAnalyzer()
-
-    previous = TodoList(
-        items=[
-            TodoItem(task="タスクA", status="進行中"),
-            TodoItem(task="タスクB", status="未着手"),
-        ]
-    )
-    current = TodoList(items=[TodoItem(task="タスクA", status="進行中")])
+    previous = TodoList(items=[TASK_A_IN_PROGRESS, TASK_B_NOT_STARTED])
+    current = TodoList(items=[TASK_A_IN_PROGRESS])
 
     result = analyzer.analyze(current, previous)
 
@@ -122,10 +115,8 @@ def test_diff_analyzer_removed_task():
     assert result.removed_tasks[0].task_name == "タスクB"
 
 
-def test_diff_analyzer_similar_task():
+def test_diff_analyzer_similar_task(analyzer):
     """類似タスクのマッチングテスト"""
-    analyzer = DiffAnalyzer()
-
     previous = TodoList(items=[TodoItem(task="機能Aの実装", status="進行中")])
     current = TodoList(items=[TodoItem(task="機能Aの実装（修正版）", status="進行中")])
 
@@ -136,17 +127,38 @@ def test_diff_analyzer_similar_task():
     assert len(result.removed_tasks) == 0
 
 
-def test_diff_analyzer_completed_statuses():
-    """完了ステータスのバリエーションテスト"""
-    analyzer = DiffAnalyzer()
+def test_diff_analyzer_duplicate_task_names(analyzer):
+    """同名タスクが複数ある場合のテスト"""
+    previous = TodoList(
+        items=[
+            TodoItem(task="定例会議", status="進行中"),
+            TodoItem(task="定例会議", status="進行中"),
+        ]
+    )
+    current = TodoList(
+        items=[
+            TodoItem(task="定例会議", status="完了"),
+            TodoItem(task="定例会議", status="進行中"),
+        ]
+    )
 
-    test_cases = ["完了", "done", "Done", "DONE", "finished", "完", "済"]
+    result = analyzer.analyze(current, previous)
 
-    for status in test_cases:
-        previous = TodoList(items=[TodoItem(task="テスト", status="進行中")])
-        current = TodoList(items=[TodoItem(task="テスト", status=status)])
+    # 同名タスクが1件ずつ対応付けられ、取りこぼしがない
+    assert len(result.completed_tasks) == 1
+    assert len(result.unchanged_tasks) == 1
+    assert len(result.removed_tasks) == 0
 
-        result = analyzer.analyze(current, previous)
-        assert (
-            len(result.completed_tasks) == 1
-        ), f"ステータス '{status}' が完了として認識されません"
+
+@pytest.mark.parametrize(
+    "status", ["完了", "done", "Done", "DONE", "finished", "完", "済"]
+)
+def test_diff_analyzer_completed_statuses(analyzer, status):
+    """完了ステータスのバリエーションテスト"""
+    previous = TodoList(items=[TEST_IN_PROGRESS])
+    current = TodoList(items=[TodoItem(task="テスト", status=status)])
+
+    result = analyzer.analyze(current, previous)
+    assert (
+        len(result.completed_tasks) == 1
+    ), f"ステータス '{status}' が完了として認識されません"
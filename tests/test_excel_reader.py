@@ -1,61 +1,35 @@
 """Excel読み込みモジュールのテスト"""
 
-import tempfile
 from datetime import date
 from pathlib import Path
 
 import pytest
-from openpyxl import Workbook
 
 from sonta_kun.excel_reader import ExcelReadError, ExcelReader, TodoItem, TodoList
 
 
-@pytest.fixture
-def sample_excel_file():
-    """サンプルExcelファイルを作成"""
-    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as f:
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "タスク"
-
-        # ヘッダー
-        ws["A1"] = "タスク"
-        ws["B1"] = "ステータス"
-        ws["C1"] = "期限"
-        ws["D1"] = "優先度"
+@pytest.fixture(scope="module")
+def reader():
+    """モジュール内で共有するExcelReader（読み込みごとに列対応を再構築する）"""
+    return ExcelReader()
 
-        # データ
-        ws["A2"] = "機能Aの実装"
-        ws["B2"] = "進行中"
-        ws["C2"] = date(2024, 12, 31)
-        ws["D2"] = "高"
 
-        ws["A3"] = "テスト作成"
-        ws["B3"] = "未着手"
-        ws["C3"] = date(2025, 1, 15)
-        ws["D3"] = "中"
+# チェックイン済みのテストデータ（ヘッダー付き / ヘッダーなし）。
+# テストは読み込みしかしないため、実行のたびにopenpyxlでXLSXを
+# 生成し直す必要がない
+_DATA_DIR = Path(__file__).parent / "data"
 
-        wb.save(f.name)
-        yield Path(f.name)
 
-    Path(f.name).unlink(missing_ok=True)
+@pytest.fixture(scope="session")
+def sample_excel_file():
+    """サンプルExcelファイル（タスク/ステータス/期限/優先度の4列）"""
+    return _DATA_DIR / "sample.xlsx"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_excel_file():
-    """シンプルなExcelファイルを作成（ヘッダーなし）"""
-    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as f:
-        wb = Workbook()
-        ws = wb.active
-
-        ws["A1"] = "タスク1"
-        ws["A2"] = "タスク2"
-        ws["A3"] = "タスク3"
-
-        wb.save(f.name)
-        yield Path(f.name)
-
-    Path(f.name).unlink(missing_ok=True)
+    """シンプルなExcelファイル（ヘッダーなし・タスク1〜3）"""
+    return _DATA_DIR / "simple.xlsx"
 
 
 def test_todo_item_to_dict():
@@ -89,9 +63,26 @@ def test_todo_list_to_text():
     assert "優先度: 高" in text
 
 
-def test_excel_reader_with_headers(sample_excel_file):
+def test_todo_list_from_lines():
+    """テキスト行からのToDoリスト構築テスト"""
+    lines = [
+        "機能Aの実装 [進行中] (高)",
+        "",
+        "テスト作成",
+        "[完了]",  # タスク名が残らない行はスキップ
+    ]
+    todo_list = TodoList.from_lines(lines, source_file="自由記述")
+
+    assert todo_list.source_file == "自由記述"
+    assert len(todo_list.items) == 2
+    assert todo_list.items[0].task == "機能Aの実装"
+    assert todo_list.items[0].status == "進行中"
+    assert todo_list.items[0].priority == "高"
+    assert todo_list.items[1].task == "テスト作成"
+
+
+def test_excel_reader_with_headers(reader, sample_excel_file):
     """ヘッダー付きExcelファイルの読み込みテスト"""
-    reader = ExcelReader()
     result = reader.read(sample_excel_file)
 
     assert len(result.items) == 2
@@ -101,9 +92,8 @@ def test_excel_reader_with_headers(sample_excel_file):
     assert result.items[0].priority == "高"
 
 
-def test_excel_reader_without_headers(simple_excel_file):
+def test_excel_reader_without_headers(reader, simple_excel_file):
     """ヘッダーなしExcelファイルの読み込みテスト"""
-    reader = ExcelReader()
     result = reader.read(simple_excel_file)
 
     assert len(result.items) == 3
@@ -111,23 +101,16 @@ def test_excel_reader_without_headers(simple_excel_file):
     assert result.items[1].task == "タスク2"
 
 
-def test_excel_reader_file_not_found():
+def test_excel_reader_file_not_found(reader):
     """存在しないファイルのエラーテスト"""
-    reader = ExcelReader()
-
     with pytest.raises(ExcelReadError, match="ファイルが見つかりません"):
         reader.read("/nonexistent/file.xlsx")
 
 
-def test_excel_reader_unsupported_format():
+def test_excel_reader_unsupported_format(reader, tmp_path):
     """サポートされていないファイル形式のエラーテスト"""
-    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-        f.write(b"test")
-        temp_path = Path(f.name)
-
-    try:
-        reader = ExcelReader()
-        with pytest.raises(ExcelReadError, match="サポートされていないファイル形式"):
-            reader.read(temp_path)
-    finally:
-        temp_path.unlink(missing_ok=True)
+    temp_path = tmp_path / "todo.txt"
+    temp_path.write_bytes(b"test")
+
+    with pytest.raises(ExcelReadError, match="サポートされていないファイル形式"):
+        reader.read(temp_path)
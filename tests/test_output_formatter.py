@@ -1,8 +1,5 @@
 """出力フォーマッターのテスト"""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
 from sonta_kun.output_formatter import (
@@ -11,12 +8,15 @@ from sonta_kun.output_formatter import (
     OutputFormatter,
     ReportExporter,
 )
-from sonta_kun.report_generator import GeneratedReport
 
 
 @pytest.fixture
 def sample_report():
     """サンプル報告書"""
+    # report_generator（Bedrockクライアントなどを連れてくる）は
+    # 収集時ではなくフィクスチャ実行時に読み込む
+    from sonta_kun.report_generator import GeneratedReport
+
     return GeneratedReport(
         executive_summary="今週はプロジェクトAの主要機能を完成させました。スケジュール通りに進捗しています。",
         details="プロジェクトAについて、認証機能とデータベース連携を実装しました。テストも完了しています。",
@@ -31,42 +31,60 @@ def test_output_format_enum():
     assert OutputFormat.MARKDOWN.value == "markdown"
 
 
-def test_output_formatter_markdown(sample_report):
-    """Markdownフォーマットのテスト"""
-    formatter = OutputFormatter(max_summary_chars=300)
-    result = formatter.format(
-        sample_report,
-        output_format=OutputFormat.MARKDOWN,
-        report_type="weekly",
-        target_name="山田課長",
-    )
-
-    assert result.format_type == OutputFormat.MARKDOWN
-    assert "## エグゼクティブサマリ" in result.executive_summary
-    assert "## 詳細内容" in result.details
-    assert "## ネクストアクション" in result.next_actions
-    assert "# 週報" in result.full_report
-    assert "山田課長向け" in result.full_report
-    assert "- プロジェクトBの要件定義を開始" in result.next_actions
-
-
-def test_output_formatter_text(sample_report):
-    """テキストフォーマットのテスト"""
+@pytest.mark.parametrize(
+    "output_format,report_type,target_name,summary_marker,details_marker,"
+    "actions_marker,title_marker,action_line",
+    [
+        (
+            OutputFormat.MARKDOWN,
+            "weekly",
+            "山田課長",
+            "## エグゼクティブサマリ",
+            "## 詳細内容",
+            "## ネクストアクション",
+            "# 週報",
+            "- プロジェクトBの要件定義を開始",
+        ),
+        (
+            OutputFormat.TEXT,
+            "monthly",
+            "佐藤室長",
+            "【エグゼクティブサマリ】",
+            "【詳細内容】",
+            "【ネクストアクション】",
+            "月報",
+            "1. プロジェクトBの要件定義を開始",
+        ),
+    ],
+    ids=["markdown", "text"],
+)
+def test_output_formatter_format(
+    sample_report,
+    output_format,
+    report_type,
+    target_name,
+    summary_marker,
+    details_marker,
+    actions_marker,
+    title_marker,
+    action_line,
+):
+    """Markdown・テキストフォーマットのテスト"""
     formatter = OutputFormatter(max_summary_chars=300)
     result = formatter.format(
         sample_report,
-        output_format=OutputFormat.TEXT,
-        report_type="monthly",
-        target_name="佐藤室長",
+        output_format=output_format,
+        report_type=report_type,
+        target_name=target_name,
     )
 
-    assert result.format_type == OutputFormat.TEXT
-    assert "【エグゼクティブサマリ】" in result.executive_summary
-    assert "【詳細内容】" in result.details
-    assert "【ネクストアクション】" in result.next_actions
-    assert "月報" in result.full_report
-    assert "佐藤室長" in result.full_report
-    assert "1. プロジェクトBの要件定義を開始" in result.next_actions
+    assert result.format_type == output_format
+    assert summary_marker in result.executive_summary
+    assert details_marker in result.details
+    assert actions_marker in result.next_actions
+    assert title_marker in result.full_report
+    assert target_name in result.full_report
+    assert action_line in result.next_actions
 
 
 def test_output_formatter_truncate():
@@ -116,29 +134,24 @@ def test_output_formatter_next_actions_only_text(sample_report):
     assert "プロジェクトBの要件定義を開始" in actions
 
 
-def test_report_exporter_to_file(sample_report):
+def test_report_exporter_to_file(sample_report, tmp_path):
     """ファイルエクスポートテスト"""
     exporter = ReportExporter()
+    temp_path = tmp_path / "report.md"
+
+    result_path = exporter.export_to_file(
+        sample_report,
+        str(temp_path),
+        output_format=OutputFormat.MARKDOWN,
+        report_type="weekly",
+        target_name="テスト",
+    )
+
+    assert result_path == str(temp_path)
+    content = temp_path.read_text(encoding="utf-8")
 
-    with tempfile.NamedTemporaryFile(suffix=".md", delete=False) as f:
-        temp_path = f.name
-
-    try:
-        result_path = exporter.export_to_file(
-            sample_report,
-            temp_path,
-            output_format=OutputFormat.MARKDOWN,
-            report_type="weekly",
-            target_name="テスト",
-        )
-
-        with open(result_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        assert "# 週報" in content
-        assert "エグゼクティブサマリ" in content
-    finally:
-        Path(temp_path).unlink(missing_ok=True)
+    assert "# 週報" in content
+    assert "エグゼクティブサマリ" in content
 
 
 def test_formatted_output_dataclass():
@@ -1,20 +1,8 @@
 """プロファイルマネージャーのテスト"""
 
-import tempfile
-from pathlib import Path
-
-import pytest
-
 from sonta_kun.profile_manager import ProfileManager, TargetProfile
 
 
-@pytest.fixture
-def temp_storage_dir():
-    """一時ストレージディレクトリ"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
-
-
 def test_target_profile_to_dict():
     """TargetProfileの辞書変換テスト"""
     profile = TargetProfile(
@@ -127,3 +115,27 @@ def test_profile_manager_reset_to_defaults(temp_storage_dir):
 
     manager.reset_to_defaults()
     assert len(manager.list_profiles()) == 4
+
+
+def test_profile_manager_batch_updates(temp_storage_dir):
+    """batch中の複数更新がまとめて保存されるテスト"""
+    manager = ProfileManager(storage_dir=temp_storage_dir)
+    profiles_file = temp_storage_dir / "profiles.json"
+
+    # 遅延読み込みを確定させてからファイルの更新時刻を取る
+    manager.get_profile_names()
+    before = profiles_file.stat().st_mtime_ns
+    with manager.batch():
+        manager.add_profile(
+            TargetProfile(name="一括1", role="テスト", focus="テスト重視")
+        )
+        manager.add_profile(
+            TargetProfile(name="一括2", role="テスト", focus="テスト重視")
+        )
+        # ブロック内ではまだ書き込まれない
+        assert profiles_file.stat().st_mtime_ns == before
+
+    # ブロックを抜けると1回だけ保存され、再読み込みで反映されている
+    reloaded = ProfileManager(storage_dir=temp_storage_dir)
+    assert reloaded.get_profile("一括1") is not None
+    assert reloaded.get_profile("一括2") is not None
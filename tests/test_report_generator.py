@@ -0,0 +1,121 @@
+"""報告書生成モジュール（レスポンス解析）のテスト"""
+
+import pytest
+
+from sonta_kun.report_generator import (
+    _SECTION_HEADERS,
+    _bullet_content,
+    _casefold_aligned,
+    _find_section,
+    _parse_bullet_list,
+)
+
+
+def _extract(response: str, section: str) -> str:
+    """テスト用にレスポンスから1セクションを取り出す"""
+    return _find_section(
+        response, _casefold_aligned(response), _SECTION_HEADERS[section]
+    )
+
+
+def test_find_section_basic():
+    """セクション抽出テスト"""
+    response = (
+        "## エグゼクティブサマリ\n今週の進捗です。\n\n"
+        "## 詳細内容\n詳細な説明。\n\n"
+        "## ネクストアクション\n- 次のタスク\n"
+    )
+
+    assert _extract(response, "summary") == "今週の進捗です。"
+    assert _extract(response, "details") == "詳細な説明。"
+    assert _extract(response, "next_actions") == "- 次のタスク"
+
+
+def test_find_section_case_insensitive():
+    """英語ヘッダーの大文字小文字を無視するテスト"""
+    response = "## Executive Summary\nsummary body\n\n## Details\ndetail body\n"
+
+    assert _extract(response, "summary") == "summary body"
+    assert _extract(response, "details") == "detail body"
+
+
+def test_find_section_with_length_changing_casefold():
+    """casefoldで長さが変わる文字が前置されても抽出できるテスト"""
+    # "ß"はcasefoldで"ss"になり、単純なcasefold文字列のインデックスを
+    # 原文に適用するとヘッダー位置がずれる
+    response = (
+        "Straße のレビュー結果です。\n\n"
+        "## エグゼクティブサマリ\n今週の進捗です。\n\n"
+        "## 詳細内容\n詳細な説明。\n"
+    )
+
+    assert _extract(response, "summary") == "今週の進捗です。"
+    assert _extract(response, "details") == "詳細な説明。"
+
+
+def test_casefold_aligned_keeps_length():
+    """_casefold_alignedが常に原文と同じ長さを返すテスト"""
+    text = "Straße と İstanbul を含む TEXT"
+    lowered = _casefold_aligned(text)
+
+    assert len(lowered) == len(text)
+    assert "text" in lowered
+
+
+@pytest.mark.parametrize(
+    "line,expected",
+    [
+        ("- タスクA", "タスクA"),
+        ("* タスクB", "タスクB"),
+        ("• タスクC", "タスクC"),
+        ("1. タスクD", "タスクD"),
+        ("2) タスクE", "タスクE"),
+        ("  - インデント付き", "インデント付き"),
+        ("継続行のテキスト", None),
+        ("", None),
+        ("   ", None),
+    ],
+    ids=[
+        "hyphen",
+        "asterisk",
+        "bullet",
+        "numbered-dot",
+        "numbered-paren",
+        "indented",
+        "plain",
+        "empty",
+        "whitespace",
+    ],
+)
+def test_bullet_content(line, expected):
+    """箇条書き開始行の判定テスト"""
+    assert _bullet_content(line) == expected
+
+
+def test_parse_bullet_list_basic():
+    """箇条書きのリスト変換テスト"""
+    text = "- アクション1\n- アクション2\n1. アクション3"
+    assert _parse_bullet_list(text) == ["アクション1", "アクション2", "アクション3"]
+
+
+def test_parse_bullet_list_continuation():
+    """継続行が前のアイテムに連結されるテスト"""
+    text = "- アクション1\n続きの説明\n- アクション2"
+    items = _parse_bullet_list(text)
+
+    assert items == ["アクション1\n続きの説明", "アクション2"]
+
+
+def test_parse_bullet_list_blank_line_keeps_item():
+    """空行が新しいアイテムの開始と誤認されないテスト"""
+    text = "- item one\ncontinuation\n\ntrailing paragraph"
+    items = _parse_bullet_list(text)
+
+    # 空行で分割されず1アイテムのまま
+    assert len(items) == 1
+    assert items[0].startswith("item one\ncontinuation")
+
+
+def test_parse_bullet_list_empty():
+    """空テキストのテスト"""
+    assert _parse_bullet_list("") == []
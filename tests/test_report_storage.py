@@ -1,21 +1,12 @@
 """報告データストレージのテスト"""
 
 import json
-import tempfile
-from pathlib import Path
 
 import pytest
 
 from sonta_kun.report_storage import ReportData, ReportStorage, StorageError
 
 
-@pytest.fixture
-def temp_storage_dir():
-    """一時ストレージディレクトリ"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
-
-
 @pytest.fixture
 def sample_report():
     """サンプル報告データ"""
@@ -79,35 +70,66 @@ def test_report_storage_save_and_get(temp_storage_dir, sample_report):
     assert latest.target_person == "山田課長"
 
 
-def test_report_storage_filter_by_type(temp_storage_dir):
+@pytest.fixture(scope="module")
+def populated_storage(tmp_path_factory):
+    """週報と月報を1件ずつ保存した共有ストレージ（読み取り専用で使う）"""
+    storage = ReportStorage(storage_dir=tmp_path_factory.mktemp("reports"))
+    storage.save_report(
+        ReportData(
+            report_type="weekly",
+            target_person="山田課長",
+            created_at="2024-12-01T10:00:00",
+            todo_summary="",
+            executive_summary="週報",
+            details="",
+        )
+    )
+    storage.save_report(
+        ReportData(
+            report_type="monthly",
+            target_person="佐藤室長",
+            created_at="2024-12-02T10:00:00",
+            todo_summary="",
+            executive_summary="月報",
+            details="",
+        )
+    )
+    return storage
+
+
+@pytest.mark.parametrize(
+    "report_type,expected", [("weekly", "週報"), ("monthly", "月報")]
+)
+def test_report_storage_filter_by_type(populated_storage, report_type, expected):
     """報告タイプでのフィルタリングテスト"""
+    latest = populated_storage.get_latest_report(report_type=report_type)
+    assert latest.executive_summary == expected
+
+
+def test_report_storage_filter_after_file_removed(temp_storage_dir, sample_report):
+    """ファイル削除後もフィルタ付き取得がエラーにならないテスト"""
     storage = ReportStorage(storage_dir=temp_storage_dir)
+    storage.save_report(sample_report)
+    assert len(storage.get_reports(report_type="weekly")) == 1
 
-    weekly_report = ReportData(
-        report_type="weekly",
-        target_person="山田課長",
-        created_at="2024-12-01T10:00:00",
-        todo_summary="",
-        executive_summary="週報",
-        details="",
-    )
-    monthly_report = ReportData(
-        report_type="monthly",
-        target_person="佐藤室長",
-        created_at="2024-12-02T10:00:00",
-        todo_summary="",
-        executive_summary="月報",
-        details="",
-    )
+    (temp_storage_dir / "reports.jsonl").unlink()
 
-    storage.save_report(weekly_report)
-    storage.save_report(monthly_report)
+    # 古い二次索引が残っているとIndexErrorになる
+    assert storage.get_reports(report_type="weekly") == []
 
-    weekly_latest = storage.get_latest_report(report_type="weekly")
-    assert weekly_latest.executive_summary == "週報"
 
-    monthly_latest = storage.get_latest_report(report_type="monthly")
-    assert monthly_latest.executive_summary == "月報"
+def test_report_storage_migrates_legacy_json(temp_storage_dir, sample_report):
+    """旧形式reports.jsonからの移行テスト"""
+    legacy_path = temp_storage_dir / "reports.json"
+    with open(legacy_path, "w", encoding="utf-8") as f:
+        json.dump([sample_report.to_dict()], f, ensure_ascii=False)
+
+    storage = ReportStorage(storage_dir=temp_storage_dir)
+
+    assert (temp_storage_dir / "reports.jsonl").exists()
+    latest = storage.get_latest_report()
+    assert latest is not None
+    assert latest.target_person == "山田課長"
 
 
 def test_report_storage_load_from_file(temp_storage_dir, sample_report):
@@ -122,28 +144,30 @@ def test_report_storage_load_from_file(temp_storage_dir, sample_report):
     assert loaded.target_person == "山田課長"
 
 
-def test_report_storage_export_json(temp_storage_dir, sample_report):
-    """JSONエクスポートテスト"""
-    storage = ReportStorage(storage_dir=temp_storage_dir)
-    export_path = temp_storage_dir / "export.json"
-
-    storage.export_report(sample_report, export_path)
+def _verify_json_export(export_path):
+    """JSONとして読み戻して対象者名を検証する"""
+    # json.loadsはUTF-8のbytesを直接受け取れるためデコードを挟まない
+    data = json.loads(export_path.read_bytes())
+    assert data["target_person"] == "山田課長"
 
-    with open(export_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
 
-    assert data["target_person"] == "山田課長"
+def _verify_text_export(export_path):
+    """テキストとして読み戻して主要項目を検証する"""
+    content = export_path.read_text(encoding="utf-8")
+    assert "山田課長" in content
+    assert "週報" in content
 
 
-def test_report_storage_export_text(temp_storage_dir, sample_report):
-    """テキストエクスポートテスト"""
+@pytest.mark.parametrize(
+    "suffix,verify",
+    [(".json", _verify_json_export), (".txt", _verify_text_export)],
+    ids=["json", "text"],
+)
+def test_report_storage_export(temp_storage_dir, sample_report, suffix, verify):
+    """JSON・テキストエクスポートテスト"""
     storage = ReportStorage(storage_dir=temp_storage_dir)
-    export_path = temp_storage_dir / "export.txt"
+    export_path = temp_storage_dir / f"export{suffix}"
 
     storage.export_report(sample_report, export_path)
 
-    with open(export_path, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    assert "山田課長" in content
-    assert "週報" in content
+    verify(export_path)